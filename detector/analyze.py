@@ -5,7 +5,9 @@ from __future__ import annotations
 
 import argparse
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Final
 
 # プロジェクトのsrcディレクトリをパスに追加
 project_root = Path(__file__).parent
@@ -13,7 +15,7 @@ src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
 
 try:
-    from detector.core.mora import count_mora, normalize_reading
+    from detector.core.mora import count_mora
     from detector.tokenizer.sudachi import SudachiTokenizer
 except ImportError as e:
     print(f"インポートエラー: {e}")
@@ -21,107 +23,135 @@ except ImportError as e:
     sys.exit(1)
 
 
+# 品詞情報の各階層のラベル（part_of_speech()の先頭6要素に対応）
+POS_LABELS: Final[tuple[str, ...]] = ("大分類", "中分類", "小分類", "細分類", "活用型", "活用形")
+
+# 品詞情報で値が設定されていないことを示す記号
+POS_UNSET: Final[str] = "*"
+
+
+@lru_cache(maxsize=4)
+def _get_tokenizer(mode: str = "C") -> SudachiTokenizer:
+    """分割モードごとにSudachiTokenizerを1度だけ生成して再利用する。."""
+    return SudachiTokenizer(mode=mode)
+
+
 def analyze_text(text: str, verbose: bool = False) -> None:
-    """テキストの形態素解析結果を表示する。."""
-    print(f"📝 入力テキスト: {text}")
-    print("=" * 80)
+    """テキストの形態素解析結果を表示する。.
 
-    # 既存のSudachiTokenizerを使用して、詳細情報も取得
-    tokenizer = SudachiTokenizer(mode="C")
+    出力はバッファに組み立ててから一度に書き出す。
+    """
+    out: list[str] = [f"📝 入力テキスト: {text}\n", "=" * 80 + "\n"]
 
     try:
-        # 詳細な形態素解析のためにSudachiPyを直接使用
-        sudachi_tokenizer = tokenizer.tokenizer
-        morphemes = sudachi_tokenizer.tokenize(text, tokenizer._mode)
-
-        if not morphemes:
-            print("❌ 形態素が見つかりませんでした")
-            return
-
-        print(f"🔍 形態素解析結果 ({len(morphemes)}形態素)")
-        print("-" * 80)
-
-        total_mora = 0
-
-        for i, morpheme in enumerate(morphemes, 1):
-            # 基本情報
-            surface = morpheme.surface()
-            reading_form = morpheme.reading_form()
-            normalized_form = morpheme.normalized_form()
-            dictionary_form = morpheme.dictionary_form()
-
-            # 詳細な品詞情報を取得
-            pos_tags = morpheme.part_of_speech()
-
-            # 読みを正規化してモーラ数計算
-            normalized_reading = normalize_reading(reading_form)
-            mora_count = count_mora(normalized_reading)
-            total_mora += mora_count
-
-            print(f"{i:2d}. 表記: {surface:<12} 読み: {reading_form:<15}")
-            print(f"    正規化形: {normalized_form:<10} 辞書形: {dictionary_form:<15}")
-
-            # 品詞の詳細情報
-            pos_labels = ["大分類", "中分類", "小分類", "細分類", "活用型", "活用形"]
-            print("    品詞情報:")
-            for _j, (label, pos_tag) in enumerate(zip(pos_labels, pos_tags[:6], strict=False)):
-                if pos_tag and pos_tag != "*":
-                    print(f"      {label}: {pos_tag}")
-
-            print(f"    モーラ数: {mora_count}")
-
-            if verbose:
-                # より詳細な情報を表示
-                if len(pos_tags) > 6:
-                    extra_tags = [tag for tag in pos_tags[6:] if tag != "*"]
-                    if extra_tags:
-                        print(f"    追加品詞情報: {', '.join(extra_tags)}")
-
-                # 全品詞情報のリスト表示
-                print(f"    全品詞タグ: {pos_tags}")
-
-                # 語彙素情報（利用可能なメソッドのみ）
-                try:
-                    word_id = morpheme.word_id()
-                    print(f"    語彙素ID: {word_id}")
-                except AttributeError:
-                    print("    語彙素ID: (取得不可)")
-
-                # その他の利用可能な情報
-                try:
-                    begin = morpheme.begin()
-                    end = morpheme.end()
-                    print(f"    位置: {begin}-{end}")
-                except AttributeError:
-                    pass
-
-            print()
-
-        print(f"📊 総モーラ数: {total_mora}")
-
-        # 川柳パターンとの比較
-        patterns = [
-            ("標準川柳", [5, 7, 5]),
-            ("字余り5-8-5", [5, 8, 5]),
-            ("字余り6-7-5", [6, 7, 5]),
-            ("字余り5-7-6", [5, 7, 6]),
-        ]
-
-        print("\n🎋 川柳パターン適合性:")
-        print("-" * 40)
-        for name, pattern in patterns:
-            expected = sum(pattern)
-            match = "✅" if total_mora == expected else "❌"
-            print(f"{match} {name}: {pattern} (合計{expected}モーラ)")
-
+        _format_analysis(text, verbose, out)
     except Exception as e:
-        print(f"❌ 解析エラー: {e}")
+        out.append(f"❌ 解析エラー: {e}\n")
+        sys.stdout.writelines(out)
         import traceback
 
         if verbose:
             traceback.print_exc()
         sys.exit(1)
 
+    sys.stdout.writelines(out)
+
+
+def _format_analysis(text: str, verbose: bool, out: list[str]) -> None:
+    """形態素解析結果の表示行を組み立てる。.
+
+    Args:
+        text: 解析するテキスト
+        verbose: 詳細情報を含めるかどうか
+        out: 表示行（改行付き）を追加するバッファ
+    """
+    write = out.append
+
+    # 既存のSudachiTokenizerを使用して、詳細情報も取得（辞書の読み込みは初回のみ）
+    tokenizer = _get_tokenizer("C")
+
+    # 詳細な形態素解析のためにSudachiPyを直接使用
+    sudachi_tokenizer = tokenizer.tokenizer
+    morphemes = sudachi_tokenizer.tokenize(text, tokenizer._mode)
+
+    if not morphemes:
+        write("❌ 形態素が見つかりませんでした\n")
+        return
+
+    write(f"🔍 形態素解析結果 ({len(morphemes)}形態素)\n")
+    write("-" * 80 + "\n")
+
+    total_mora = 0
+
+    for i, morpheme in enumerate(morphemes, 1):
+        # 基本情報
+        surface = morpheme.surface()
+        reading_form = morpheme.reading_form()
+        normalized_form = morpheme.normalized_form()
+        dictionary_form = morpheme.dictionary_form()
+
+        # 詳細な品詞情報を取得
+        pos_tags = morpheme.part_of_speech()
+
+        # モーラ数計算（カタカナのままでもひらがなと同じモーラ数になるため正規化は不要）
+        mora_count = count_mora(reading_form)
+        total_mora += mora_count
+
+        # 桁揃えは書式指定ではなくljust/rjustで行う（書式指定の解析を省略）
+        write(f"{str(i).rjust(2)}. 表記: {surface.ljust(12)} 読み: {reading_form.ljust(15)}\n")
+        write(f"    正規化形: {normalized_form.ljust(10)} 辞書形: {dictionary_form.ljust(15)}\n")
+
+        # 品詞の詳細情報（zipはPOS_LABELSの長さで打ち切られる）
+        write("    品詞情報:\n")
+        for label, pos_tag in zip(POS_LABELS, pos_tags, strict=False):
+            if pos_tag and pos_tag != POS_UNSET:
+                write(f"      {label}: {pos_tag}\n")
+
+        write(f"    モーラ数: {mora_count}\n")
+
+        if verbose:
+            # より詳細な情報を表示
+            extra_tags = ", ".join(tag for tag in pos_tags[len(POS_LABELS) :] if tag != POS_UNSET)
+            if extra_tags:
+                write(f"    追加品詞情報: {extra_tags}\n")
+
+            # 全品詞情報のリスト表示
+            write(f"    全品詞タグ: {pos_tags}\n")
+
+            # 語彙素情報（利用可能なメソッドのみ）
+            try:
+                word_id = morpheme.word_id()
+                write(f"    語彙素ID: {word_id}\n")
+            except AttributeError:
+                write("    語彙素ID: (取得不可)\n")
+
+            # その他の利用可能な情報
+            try:
+                begin = morpheme.begin()
+                end = morpheme.end()
+                write(f"    位置: {begin}-{end}\n")
+            except AttributeError:
+                pass
+
+        write("\n")
+
+    write(f"📊 総モーラ数: {total_mora}\n")
+
+    # 川柳パターンとの比較
+    patterns = [
+        ("標準川柳", [5, 7, 5]),
+        ("字余り5-8-5", [5, 8, 5]),
+        ("字余り6-7-5", [6, 7, 5]),
+        ("字余り5-7-6", [5, 7, 6]),
+    ]
+
+    write("\n🎋 川柳パターン適合性:\n")
+    write("-" * 40 + "\n")
+    for name, pattern in patterns:
+        expected = sum(pattern)
+        match = "✅" if total_mora == expected else "❌"
+        write(f"{match} {name}: {pattern} (合計{expected}モーラ)\n")
+
 
 def main() -> None:
     """メイン関数。."""
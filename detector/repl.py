@@ -41,12 +41,13 @@ def repl() -> None:
             results = detector.detect(text)
 
             if results:
-                print(f"✅ {len(results)}件検知:")
+                # 検知結果の表示行をまとめて組み立ててから一度に出力する
+                lines = [f"✅ {len(results)}件検知:"]
                 for i, result in enumerate(results, 1):
-                    print(
-                        f"  {i}. [{result.pattern.value}] {'有効' if result.is_valid else '無効'}"
-                    )
-                    print(f"     {result.original_text} ({result.full_reading})")
+                    status = "有効" if result.is_valid else "無効"
+                    lines.append(f"  {i}. [{result.pattern.value}] {status}")
+                    lines.append(f"     {result.original_text} ({result.full_reading})")
+                print("\n".join(lines))
 
         except KeyboardInterrupt:
             print("\n終了します。")
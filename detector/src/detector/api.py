@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
 from collections.abc import AsyncGenerator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from .core.detector import SenryuDetector
+from .models import DetectionResult
 from .models.api import (
+    BatchDetectItem,
+    BatchDetectRequest,
+    BatchDetectResponse,
     DetectRequest,
     DetectResponse,
     ErrorResponse,
@@ -25,6 +33,73 @@ logger = logging.getLogger(__name__)
 # グローバル検知器インスタンス
 detector: SenryuDetector | None = None
 
+# 検知結果キャッシュの最大エントリ数
+DETECT_CACHE_SIZE = 10000
+
+# 一括検知で検知処理を実行するスレッド数
+DETECT_EXECUTOR_WORKERS = 4
+
+
+@lru_cache(maxsize=DETECT_CACHE_SIZE)
+def _cached_detect(text: str) -> tuple[DetectionResult, ...]:
+    """テキスト単位で検知結果をキャッシュ。.
+
+    同一テキストの再リクエストでは形態素解析を省略する。
+    キャッシュされた結果は共有されるため、呼び出し側で変更してはならない。
+
+    Args:
+        text: 分析する日本語テキスト
+
+    Returns:
+        検知結果のタプル
+    """
+    if detector is None:
+        raise RuntimeError("検知器が初期化されていません")
+    return tuple(detector.detect(text))
+
+
+def _detect_or_empty(text: str) -> tuple[DetectionResult, ...]:
+    """空テキストを検知結果なしとして扱いつつ検知を実行。.
+
+    Args:
+        text: 分析する日本語テキスト
+
+    Returns:
+        検知結果のタプル
+    """
+    if not text.strip():
+        return ()
+    return _cached_detect(text)
+
+
+def _postprocess_results(
+    results: tuple[DetectionResult, ...], only_valid: bool, details: bool
+) -> list[DetectionResult]:
+    """リクエストオプションに応じて検知結果を整形。.
+
+    Args:
+        results: キャッシュ済みの検知結果
+        only_valid: Trueの場合、有効な結果のみを残す
+        details: Falseの場合、phraseフィールドを削除する
+
+    Returns:
+        整形済みの検知結果リスト
+    """
+    # only_validオプションが有効な場合、有効な結果のみフィルタ
+    filtered = [result for result in results if result.is_valid] if only_valid else list(results)
+
+    if details:
+        return filtered
+
+    # detailsオプションが無効な場合、phraseフィールドを削除
+    # キャッシュ内の結果を変更しないようコピーに対して行う
+    return [
+        result.model_copy(
+            update={"upper_phrase": None, "middle_phrase": None, "lower_phrase": None}
+        )
+        for result in filtered
+    ]
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -32,7 +107,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     global detector
     logger.info("川柳検知システムを初期化中...")
     try:
-        detector = SenryuDetector()
+        # 検知処理をスレッドで実行してイベントループを応答可能に保つ
+        # （SudachiPyはGILを保持するためスレッドを増やしても並列には処理されない。
+        # CPUを使い切るにはWORKERSでプロセス数を増やす）
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=DETECT_EXECUTOR_WORKERS, thread_name_prefix="detect")
+        )
+        # 形態素解析のバックエンド（'sudachi' または 'fugashi'）
+        detector = SenryuDetector(tokenizer_backend=os.getenv("TOKENIZER_BACKEND", "sudachi"))
+        _cached_detect.cache_clear()
         logger.info("初期化完了")
     except Exception as e:
         logger.error(f"初期化エラー: {e}")
@@ -111,7 +194,7 @@ async def health_check() -> HealthResponse:
             detail="検知器が初期化されていません",
         )
 
-    return HealthResponse(
+    return HealthResponse.model_construct(
         status="healthy",
         message="川柳検知システムは正常に動作しています",
         version="0.1.0",
@@ -136,21 +219,13 @@ async def detect_senryu(request: DetectRequest) -> DetectResponse:
         )
 
     try:
-        # 川柳検知実行
-        results = detector.detect(request.text)
-
-        # only_validオプションが有効な場合、有効な結果のみフィルタ
-        if request.only_valid:
-            results = [result for result in results if result.is_valid]
-
-        # detailsオプションが無効な場合、phraseフィールドを削除
-        if not request.details:
-            for result in results:
-                result.upper_phrase = None
-                result.middle_phrase = None
-                result.lower_phrase = None
+        # 川柳検知実行（キャッシュ済みの結果を優先）
+        results = _postprocess_results(
+            _cached_detect(request.text), request.only_valid, request.details
+        )
 
-        return DetectResponse(
+        # 検知結果は内部で生成済みの値のため、再検証せずにレスポンスを組み立てる
+        return DetectResponse.model_construct(
             success=True,
             results=results,
             count=len(results),
@@ -164,22 +239,50 @@ async def detect_senryu(request: DetectRequest) -> DetectResponse:
         ) from e
 
 
-def main() -> None:
-    """API サーバーを起動。."""
-    import os
+@app.post("/detect/batch", response_model=BatchDetectResponse)
+async def detect_senryu_batch(request: BatchDetectRequest) -> BatchDetectResponse:
+    """複数テキストから川柳を一括検知。."""
+    global detector
+
+    if detector is None:
+        raise HTTPException(
+            status_code=503,
+            detail="検知器が初期化されていません",
+        )
 
-    import uvicorn
+    try:
+        # 各テキストの検知をスレッドプールで並行実行し、イベントループをブロックしない
+        detected = await asyncio.gather(
+            *(asyncio.to_thread(_detect_or_empty, text) for text in request.texts)
+        )
 
-    # Cloud Runのポート環境変数を優先、デフォルトは8080
-    port = int(os.getenv("PORT", "8080"))
+        items = []
+        for text, cached in zip(request.texts, detected, strict=True):
+            results = _postprocess_results(cached, request.only_valid, request.details)
+            items.append(
+                BatchDetectItem.model_construct(text=text, results=results, count=len(results))
+            )
 
-    uvicorn.run(
-        "detector.api:app",
-        host="0.0.0.0",
-        port=port,
-        reload=False,  # 本番環境ではreloadを無効化
-        log_level="info",
-    )
+        return BatchDetectResponse.model_construct(
+            success=True,
+            results=items,
+            total_count=sum(item.count for item in items),
+        )
+
+    except Exception as e:
+        logger.error(f"Batch detection error: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"一括検知処理中にエラーが発生しました: {str(e)}",
+        ) from e
+
+
+def main() -> None:
+    """API サーバーを起動。."""
+    from .server import main as run_server
+
+    # 起動設定（ポート、ワーカー数、アクセスログ等）はサーバーのエントリーポイントと共通
+    run_server()
 
 
 if __name__ == "__main__":
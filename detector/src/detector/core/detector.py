@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Iterator
-from typing import Any
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Final
 
 from ..models.senryu import DetectionResult, SenryuPattern, SenryuPhrase, Token
-from ..tokenizer.sudachi import SudachiTokenizer
+from ..tokenizer import BaseTokenizer, create_tokenizer
 from .filters import (
     FilterChain,
     JapaneseCharacterFilter,
@@ -17,12 +22,78 @@ from .filters import (
     SokuonEndingFilter,
     UnknownWordFilter,
 )
+from .mora import JAPANESE_CHAR_PATTERN
 from .patterns import (
+    VALID_MORA_TOTALS,
     get_pattern_type,
     get_target_patterns,
     validate_senryu_rules,
 )
-from .splitters import AdaptivePOSSplitter
+from .splitters import AdaptivePOSSplitter, BaseSplitter, SplitResult, TokenArrays
+
+# テキスト正規化用のパターン（単独の句点は置換不要のため、連続する句点のみを対象とする）
+_KUTEN_PATTERN: Final[re.Pattern[str]] = re.compile(r"。{2,}")
+_WHITESPACE_PATTERN: Final[re.Pattern[str]] = re.compile(r"\s+")
+
+# 前処理結果のキャッシュサイズ（同じテキストを繰り返し検知する呼び出し向け）
+PREPROCESS_CACHE_SIZE: Final[int] = 1024
+
+# 候補の検証結果のキャッシュサイズ（同じトークン列が繰り返し現れるテキスト向け）
+VALIDATION_CACHE_SIZE: Final[int] = 4096
+
+
+def _normalize(text: str) -> str:
+    """テキストの正規化。.
+
+    Args:
+        text: 入力生テキスト
+
+    Returns:
+        正規化されたテキスト
+    """
+    # 改行を句点に変換（正規表現を使わない単純な置換）
+    normalized = text.replace("\n", "。")
+    # 複数の句点を1つに統合
+    if "。。" in normalized:
+        normalized = _KUTEN_PATTERN.sub("。", normalized)
+    # 複数の空白を1つに統合
+    normalized = _WHITESPACE_PATTERN.sub(" ", normalized)
+    # 前後の空白を除去
+    return normalized.strip()
+
+
+@lru_cache(maxsize=PREPROCESS_CACHE_SIZE)
+def _normalize_and_check(text: str) -> tuple[str, bool]:
+    """テキストを正規化し、日本語文字を含むかを判定。.
+
+    Args:
+        text: 入力生テキスト
+
+    Returns:
+        (正規化されたテキスト, 日本語文字を含む場合True)のタプル
+    """
+    return _normalize(text), JAPANESE_CHAR_PATTERN.search(text) is not None
+
+
+# 字余りパターン
+_JIAMARI_PATTERNS: Final[frozenset[SenryuPattern]] = frozenset(
+    {SenryuPattern.JIAMARI_1, SenryuPattern.JIAMARI_2, SenryuPattern.JIAMARI_3}
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _Detection:
+    """検知候補の内部表現。.
+
+    重複除去までは軽量なこの形で扱い、最終的に残った候補のみ
+    DetectionResultに変換する。
+    """
+
+    pattern: SenryuPattern
+    split_result: SplitResult
+    start_position: int
+    end_position: int
+    is_valid: bool
 
 
 class SenryuDetector:
@@ -31,12 +102,43 @@ class SenryuDetector:
     高レベルのワークフロー管理に特化し、詳細な処理は専門モジュールに委譲。
     """
 
-    def __init__(self) -> None:
-        """川柳検知器を初期化。."""
-        self.tokenizer = SudachiTokenizer(mode="C")
+    def __init__(self, tokenizer_backend: str = "sudachi") -> None:
+        """川柳検知器を初期化。.
+
+        Args:
+            tokenizer_backend: 形態素解析のバックエンド。'sudachi'（デフォルト）または
+                'fugashi'（MeCab、高速だが別途インストールが必要）
+        """
+        self.tokenizer: BaseTokenizer = create_tokenizer(tokenizer_backend)
+        # 検証結果はトークン列の内容だけで決まるため、位置を除いた結果を内容ごとに保持する
+        # 検知器はAPIの複数スレッドから共有されるため、キャッシュの更新はロックで保護する
+        self._validation_cache: OrderedDict[
+            tuple[tuple[str, str, int, str], ...], list[_Detection]
+        ] = OrderedDict()
+        self._validation_lock = threading.Lock()
+        self._init_patterns()
         self._init_filters()
         self._init_splitters()
 
+    def _init_patterns(self) -> None:
+        """検知対象パターンを初期化。.
+
+        候補ごとに関数呼び出しや線形探索を行わないよう、一度だけ構築して保持する。
+        """
+        self._target_patterns: tuple[tuple[int, int, int], ...] = tuple(get_target_patterns())
+        self._pattern_type_map: dict[tuple[int, int, int], SenryuPattern] = {
+            mora_pattern: pattern_type
+            for mora_pattern in self._target_patterns
+            if (pattern_type := get_pattern_type(mora_pattern)) is not None
+        }
+        # 総モーラ数ごとに、その総モーラ数で得られるパターンの優先度の最大値
+        self._max_priority_by_total: dict[int, int] = {}
+        for mora_pattern, pattern_type in self._pattern_type_map.items():
+            total = sum(mora_pattern)
+            self._max_priority_by_total[total] = max(
+                self._max_priority_by_total.get(total, 0), self._pattern_priority(pattern_type)
+            )
+
     def _init_filters(self) -> None:
         """フィルタチェーンを初期化。."""
         self.filter_chain = FilterChain(
@@ -52,7 +154,26 @@ class SenryuDetector:
 
     def _init_splitters(self) -> None:
         """句分割器を初期化。."""
-        self.splitter = AdaptivePOSSplitter()
+        self._splitter: BaseSplitter = AdaptivePOSSplitter()
+
+    @property
+    def splitter(self) -> BaseSplitter:
+        """句分割器を取得。."""
+        return self._splitter
+
+    @splitter.setter
+    def splitter(self, splitter: BaseSplitter) -> None:
+        """句分割器を設定。.
+
+        検証結果は句分割器に依存するため、キャッシュを破棄する。
+        分割器の設定をその場で変更した場合も、再度設定してキャッシュを破棄すること。
+
+        Args:
+            splitter: 新しい句分割器
+        """
+        self._splitter = splitter
+        with self._validation_lock:
+            self._validation_cache.clear()
 
     def detect(self, text: str) -> list[DetectionResult]:
         """指定されたテキストから川柳を検知（高レベルワークフロー）。.
@@ -80,7 +201,7 @@ class SenryuDetector:
         candidates = self._generate_and_validate_candidates(tokens, normalized_text)
 
         # 4. 結果の最適化と重複除去
-        return self._optimize_results(candidates)
+        return self._optimize_results(candidates, normalized_text)
 
     def _preprocess_text(self, text: str) -> str | None:
         """テキストの前処理。.
@@ -91,12 +212,12 @@ class SenryuDetector:
         Returns:
             正規化されたテキスト、処理不可能な場合はNone
         """
-        # 日本語文字チェック
-        if not self._contains_japanese(text):
+        # 日本語文字チェックとテキスト正規化（同じテキストの再処理はキャッシュを利用）
+        normalized, has_japanese = _normalize_and_check(text)
+        if not has_japanese:
             return None
 
-        # テキスト正規化
-        return self._normalize_text(text)
+        return normalized
 
     def _tokenize_text(self, text: str) -> list[Token] | None:
         """テキストの形態素解析。.
@@ -112,116 +233,214 @@ class SenryuDetector:
 
     def _generate_and_validate_candidates(
         self, tokens: list[Token], original_text: str
-    ) -> list[DetectionResult]:
+    ) -> Iterator[_Detection]:
         """川柳候補の生成と検証。.
 
+        候補は開始位置の昇順に生成される。
+
         Args:
             tokens: トークンリスト
             original_text: 元テキスト
 
-        Returns:
-            検証済み候補のリスト
+        Yields:
+            検証済みの有効な候補
         """
-        # 候補生成とフィルタリング
-        raw_candidates = self._find_senryu_candidates(tokens, original_text)
-        filtered_candidates = list(self.filter_chain.filter_candidates(raw_candidates))
-
-        # 各候補を検証
-        validated_candidates = []
-        for candidate_tokens in filtered_candidates:
-            results = self._validate_candidate(candidate_tokens, original_text)
-            validated_candidates.extend(results)
-
-        return [result for result in validated_candidates if result.is_valid]
+        # 候補生成とフィルタリング（TokenFilterは候補生成時に適用済み）
+        # テキスト全体のトークン配列を一度だけ構築し、候補ごとの句分割には区間を切り出して渡す
+        # 累積モーラ数は候補の探索とMoraTotalFilterの判定でも共有する
+        arrays = TokenArrays.from_tokens(tokens)
+        cumulative_mora = arrays.cumulative_mora
+        raw_spans = self._find_senryu_candidates(tokens, cumulative_mora)
+        filtered_spans = self.filter_chain.filter_spans(
+            tokens, raw_spans, skip_token_filters=True, cumulative_mora=cumulative_mora
+        )
 
-    def _optimize_results(self, candidates: list[DetectionResult]) -> list[DetectionResult]:
+        # 各候補を検証（テキスト上の位置はトークンごとの文字位置から求める）
+        token_starts, token_ends = self._calculate_token_offsets(tokens, original_text)
+        current_start = -1
+        best_priority: tuple[int, int] | None = None
+        for start_idx, end_idx in filtered_spans:
+            text_span = (token_starts[start_idx], token_ends[end_idx - 1])
+            if start_idx != current_start:
+                current_start = start_idx
+                best_priority = None
+
+            # 同じ開始位置で既に得られた結果を重複除去で上回れない候補は検証しない
+            # （候補の総モーラ数からパターンの優先度の上限が、位置からテキスト長が決まる）
+            if best_priority is not None:
+                total_mora = cumulative_mora[end_idx] - cumulative_mora[start_idx]
+                reachable = (
+                    self._max_priority_by_total.get(total_mora, 0),
+                    text_span[1] - text_span[0],
+                )
+                if reachable <= best_priority:
+                    continue
+
+            for result in self._validate_candidate(arrays.slice(start_idx, end_idx), text_span):
+                if result.is_valid:
+                    yield result
+                    priority = self._result_priority(result)
+                    if best_priority is None or priority > best_priority:
+                        best_priority = priority
+
+    def _optimize_results(
+        self, candidates: Iterable[_Detection], original_text: str
+    ) -> list[DetectionResult]:
         """結果の最適化と重複除去。.
 
         Args:
-            candidates: 検証済み候補
+            candidates: 開始位置の昇順に並んだ検証済み候補
+            original_text: 元テキスト
 
         Returns:
             最適化された結果
         """
-        if not candidates:
-            return []
-
-        # 重複除去
+        # 重複除去（結果は開始位置順）
         deduplicated = self._remove_duplicates(candidates)
 
-        # 結果をスコア順にソート（メタデータにスコア情報がある場合）
-        return sorted(deduplicated, key=lambda x: x.start_position)
+        # 残った候補のみDetectionResultに変換
+        return [self._build_result(detection, original_text) for detection in deduplicated]
+
+    def _build_result(self, detection: _Detection, original_text: str) -> DetectionResult:
+        """内部表現の検知候補からDetectionResultを作成。.
+
+        Args:
+            detection: 検知候補
+            original_text: 元テキスト
+
+        Returns:
+            検知結果
+        """
+        split_result = detection.split_result
+
+        return DetectionResult(
+            pattern=detection.pattern,
+            upper_phrase=self._create_phrase(split_result.upper_tokens),
+            middle_phrase=self._create_phrase(split_result.middle_tokens),
+            lower_phrase=self._create_phrase(split_result.lower_tokens),
+            start_position=detection.start_position,
+            end_position=detection.end_position,
+            original_text=original_text[detection.start_position : detection.end_position],
+            is_valid=detection.is_valid,
+        )
 
     def _find_senryu_candidates(
-        self, tokens: list[Token], original_text: str
-    ) -> Iterator[list[Token]]:
+        self, tokens: list[Token], cumulative_mora: list[int]
+    ) -> Iterator[tuple[int, int]]:
         """スライディングウィンドウで川柳候補を探索。.
 
+        句分割は候補の全トークンを3句に分けるため、総モーラ数がいずれの
+        川柳パターンの合計とも一致しない候補は有効な川柳になり得ない。
+        累積モーラ数が単調増加であることを利用して、開始位置ごとに
+        総モーラ数が範囲内となる終了位置を二分探索で求める。
+        また、TokenFilterで除外されるトークン（文境界記号や未知語など）をまたぐ
+        候補は、テキスト全体で一度だけ計算した位置情報により生成前に除外する。
+
         Args:
             tokens: 形態素解析トークン
-            original_text: 元テキスト
+            cumulative_mora: tokensの累積モーラ数
 
         Yields:
-            候補トークンリスト
+            候補のトークン位置の区間[start_idx, end_idx)
         """
-        for start_idx in range(len(tokens)):
-            for end_idx in range(start_idx + 3, min(len(tokens) + 1, start_idx + 20)):
-                yield tokens[start_idx:end_idx]
+        next_rejected = self.filter_chain.find_next_rejected(tokens)
+        min_total = min(VALID_MORA_TOTALS)
+        max_total = max(VALID_MORA_TOTALS)
 
-    def _validate_candidate(self, tokens: list[Token], original_text: str) -> list[DetectionResult]:
+        for start_idx in range(len(tokens)):
+            start_mora = cumulative_mora[start_idx]
+            lo = start_idx + 3
+            # 除外されるトークンを含まないよう終了位置の上限を制限
+            hi = min(len(tokens) + 1, start_idx + 20, next_rejected[start_idx] + 1)
+            if lo >= hi:
+                continue
+
+            # 総モーラ数が[min_total, max_total]となる終了位置の範囲
+            first_end = bisect_left(cumulative_mora, start_mora + min_total, lo, hi)
+            last_end = bisect_right(cumulative_mora, start_mora + max_total, first_end, hi)
+
+            for end_idx in range(first_end, last_end):
+                if cumulative_mora[end_idx] - start_mora in VALID_MORA_TOTALS:
+                    yield start_idx, end_idx
+
+    def _validate_candidate(
+        self, arrays: TokenArrays, text_span: tuple[int, int]
+    ) -> list[_Detection]:
         """候補トークンリストを川柳として検証。.
 
+        同じ候補から得られる有効な結果は、いずれも同じ位置・長さかつ総モーラ数から
+        決まる同じ種別（標準または字余り）となる。重複除去では先に得られた結果が
+        選ばれるため、有効な結果が見つかった時点で残りのパターンの試行を打ち切る。
+        同じ内容のトークン列を検証済みの場合は、句分割をやり直さずに位置だけを差し替える。
+
         Args:
-            tokens: 候補トークンリスト
-            original_text: 元テキスト
+            arrays: 候補のトークン配列（すべてのパターンの句分割で共有する）
+            text_span: 元テキスト内の候補の位置(start_pos, end_pos)
 
         Returns:
             検証結果のリスト
         """
+        key = tuple((t.surface, t.reading, t.mora_count, t.pos) for t in arrays.tokens)
+        with self._validation_lock:
+            cached = self._validation_cache.get(key)
+        if cached is not None:
+            start_pos, end_pos = text_span
+            return [
+                _Detection(
+                    pattern=result.pattern,
+                    split_result=result.split_result,
+                    start_position=start_pos,
+                    end_position=end_pos,
+                    is_valid=result.is_valid,
+                )
+                for result in cached
+            ]
+
         results = []
-        target_patterns = get_target_patterns()
 
-        for pattern in target_patterns:
-            result = self._try_pattern_match(tokens, pattern, original_text)
+        for pattern in self._target_patterns:
+            result = self._try_pattern_match(arrays, pattern, text_span)
             if result:
                 results.append(result)
-
+                if result.is_valid:
+                    break
+
+        # 上限に達したら最も古いエントリを捨てる
+        with self._validation_lock:
+            if key not in self._validation_cache:
+                while len(self._validation_cache) >= VALIDATION_CACHE_SIZE:
+                    self._validation_cache.popitem(last=False)
+            self._validation_cache[key] = results
         return results
 
     def _try_pattern_match(
         self,
-        tokens: list[Token],
+        arrays: TokenArrays,
         target_pattern: tuple[int, int, int],
-        original_text: str,
-    ) -> DetectionResult | None:
+        text_span: tuple[int, int],
+    ) -> _Detection | None:
         """特定パターンでのマッチング試行。.
 
         Args:
-            tokens: トークンリスト
+            arrays: 候補のトークン配列
             target_pattern: 目標モーラパターン
-            original_text: 元テキスト
+            text_span: 元テキスト内の候補の位置(start_pos, end_pos)
 
         Returns:
             マッチ結果、失敗時はNone
         """
         # 句分割を試行
-        split_result = self.splitter.split(tokens, target_pattern)
+        split_result = self._splitter.split_arrays(arrays, target_pattern)
         if not split_result:
             return None
 
-        # フレーズオブジェクトを作成
-        upper_phrase = self._create_phrase(split_result.upper_tokens)
-        middle_phrase = self._create_phrase(split_result.middle_tokens)
-        lower_phrase = self._create_phrase(split_result.lower_tokens)
-
         # パターンタイプを取得
+        # いずれのパターンとも一致しない分割は川柳ルールの検証を通らないため、
+        # 最も近いパターンを探さずにここで打ち切る
         actual_pattern = split_result.mora_pattern
-        pattern_type = get_pattern_type(actual_pattern)
-
+        pattern_type = self._pattern_type_map.get(actual_pattern)
         if not pattern_type:
-            pattern_type = self._get_closest_pattern_type(actual_pattern)
-            if not pattern_type:
-                return None
+            return None
 
         # 川柳ルールの厳密な検証
         is_valid = validate_senryu_rules(
@@ -231,18 +450,13 @@ class SenryuDetector:
             split_result.lower_tokens,
         )
 
-        # テキスト位置を計算
-        start_pos, end_pos = self._calculate_text_positions(tokens, original_text)
-        segment_text = original_text[start_pos:end_pos]
+        start_pos, end_pos = text_span
 
-        return DetectionResult(
+        return _Detection(
             pattern=pattern_type,
-            upper_phrase=upper_phrase,
-            middle_phrase=middle_phrase,
-            lower_phrase=lower_phrase,
+            split_result=split_result,
             start_position=start_pos,
             end_position=end_pos,
-            original_text=segment_text,
             is_valid=is_valid,
         )
 
@@ -255,150 +469,103 @@ class SenryuDetector:
         Returns:
             SenryuPhraseオブジェクト
         """
-        text = "".join(token.surface for token in tokens)
-        reading = "".join(token.reading for token in tokens)
-        mora_count = sum(token.mora_count for token in tokens)
+        # 表層形・読み・モーラ数を一度の走査で集計
+        surfaces = []
+        readings = []
+        mora_count = 0
+        for token in tokens:
+            surfaces.append(token.surface)
+            readings.append(token.reading)
+            mora_count += token.mora_count
 
         return SenryuPhrase(
             tokens=tokens,
             mora_count=mora_count,
-            text=text,
-            reading=reading,
+            text="".join(surfaces),
+            reading="".join(readings),
         )
 
-    def _contains_japanese(self, text: str) -> bool:
-        """テキストが日本語文字を含むかチェック。.
-
-        Args:
-            text: チェックするテキスト
+    def _calculate_token_offsets(
+        self, tokens: list[Token], original_text: str
+    ) -> tuple[list[int], list[int]]:
+        """各トークンの元テキスト内の文字位置を計算。.
 
-        Returns:
-            日本語文字を含む場合True
-        """
-        for char in text:
-            if (
-                "\u3040" <= char <= "\u309f"  # ひらがな
-                or "\u30a0" <= char <= "\u30ff"  # カタカナ
-                or "\u4e00" <= char <= "\u9fff"  # CJK統合漢字
-                or "\u3400" <= char <= "\u4dbf"  # CJK拡張A
-            ):
-                return True
-        return False
-
-    def _normalize_text(self, text: str) -> str:
-        """テキストの正規化。.
+        テキストを先頭から一度だけ走査し、各トークンの表層形を直前の
+        トークンの終了位置以降で探す。形態素解析器が空白などを出力しない
+        場合でも位置がずれず、同じ文字列が複数回現れても正しい位置を返す。
 
         Args:
-            text: 入力生テキスト
+            tokens: テキスト全体のトークンリスト
+            original_text: 元テキスト
 
         Returns:
-            正規化されたテキスト
+            (各トークンの開始位置のリスト, 各トークンの終了位置のリスト)
         """
-        # 改行を句点に変換
-        normalized = re.sub(r"\n", "。", text)
-        # 複数の句点を1つに統合
-        normalized = re.sub(r"。+", "。", normalized)
-        # 複数の空白を1つに統合
-        normalized = re.sub(r"\s+", " ", normalized)
-        # 前後の空白を除去
-        return normalized.strip()
-
-    def _get_closest_pattern_type(self, pattern: tuple[int, int, int]) -> SenryuPattern | None:
-        """最も近いパターンタイプを取得。.
+        starts = []
+        ends = []
+        position = 0
+        for token in tokens:
+            found = original_text.find(token.surface, position)
+            if found != -1:
+                position = found
+            starts.append(position)
+            position = min(position + len(token.surface), len(original_text))
+            ends.append(position)
+        return starts, ends
+
+    def _remove_duplicates(self, results: Iterable[_Detection]) -> list[_Detection]:
+        """重複除去。.
+
+        候補を一度走査しながら開始位置ごとの最適な結果のみを保持する。
+        優先度が同じ場合は先に現れた結果を残す。
 
         Args:
-            pattern: モーラパターン
+            results: 開始位置の昇順に並んだ川柳検知結果
 
         Returns:
-            最も近いSenryuPattern
+            開始位置ごとに1件に重複除去された結果（開始位置順）
         """
-        target_patterns = get_target_patterns()
-        best_distance = float("inf")
-        best_pattern_type = None
+        # 開始位置ごとに最適な結果とその優先度を保持し、優先度は結果ごとに一度だけ計算する
+        best_per_start: dict[int, tuple[tuple[int, int], _Detection]] = {}
+        for result in results:
+            start_pos = result.start_position
+            priority = self._result_priority(result)
+            current = best_per_start.get(start_pos)
+            if current is None or priority > current[0]:
+                best_per_start[start_pos] = (priority, result)
 
-        for target_pattern in target_patterns:
-            distance = sum(abs(p - t) for p, t in zip(pattern, target_pattern, strict=False))
-            if distance < best_distance:
-                best_distance = distance
-                best_pattern_type = get_pattern_type(target_pattern)
+        return [result for _, result in best_per_start.values()]
 
-        return best_pattern_type
+    def _result_priority(self, detection: _Detection) -> tuple[int, int]:
+        """同じ開始位置の候補間での優先度を計算。.
 
-    def _calculate_text_positions(self, tokens: list[Token], original_text: str) -> tuple[int, int]:
-        """元テキスト内の位置を計算。.
+        5-7-5パターンを最優先し、次に字余りパターン、その中では最長のテキストを優先する。
 
         Args:
-            tokens: トークンリスト
-            original_text: 元テキスト
+            detection: 検知候補
 
         Returns:
-            (start_pos, end_pos)のタプル
+            (パターンの優先度, テキスト長)のタプル（大きいほど優先）
         """
-        segment_text = "".join(token.surface for token in tokens)
-        start_pos = original_text.find(segment_text)
-        if start_pos == -1:
-            start_pos = 0
-        end_pos = start_pos + len(segment_text)
-        return start_pos, min(end_pos, len(original_text))
-
-    def _remove_duplicates(self, results: list[DetectionResult]) -> list[DetectionResult]:
-        """重複除去。.
-
-        Args:
-            results: 川柳検知結果
-
-        Returns:
-            重複除去された結果
-        """
-        if not results:
-            return []
-
-        # 開始位置でグループ化
-        position_groups: dict[int, list[DetectionResult]] = {}
-        for result in results:
-            start_pos = result.start_position
-            if start_pos not in position_groups:
-                position_groups[start_pos] = []
-            position_groups[start_pos].append(result)
-
-        # 各グループから最適な結果を選択
-        selected_results = []
-        for group in position_groups.values():
-            if len(group) == 1:
-                selected_results.append(group[0])
-            else:
-                best_result = self._select_best_result(group)
-                selected_results.append(best_result)
-
-        return sorted(selected_results, key=lambda x: x.start_position)
+        return (
+            self._pattern_priority(detection.pattern),
+            detection.end_position - detection.start_position,
+        )
 
-    def _select_best_result(self, candidates: list[DetectionResult]) -> DetectionResult:
-        """候補から最適な結果を選択。.
+    def _pattern_priority(self, pattern: SenryuPattern) -> int:
+        """パターンの優先度を取得。.
 
         Args:
-            candidates: 同じ開始位置の候補
+            pattern: 川柳パターン
 
         Returns:
-            最適な結果
+            5-7-5パターンは2、字余りパターンは1、その他は0
         """
-        # 5-7-5パターンを優先
-        standard_patterns = [c for c in candidates if c.pattern == SenryuPattern.STANDARD]
-        if standard_patterns:
-            return max(standard_patterns, key=lambda x: len(x.original_text))
-
-        # 字余りパターンの中で最長のテキストを選択
-        jiamari_patterns = [
-            c
-            for c in candidates
-            if c.pattern
-            in [SenryuPattern.JIAMARI_1, SenryuPattern.JIAMARI_2, SenryuPattern.JIAMARI_3]
-        ]
-
-        if jiamari_patterns:
-            return max(jiamari_patterns, key=lambda x: len(x.original_text))
-
-        # その他の場合は最長のテキストを選択
-        return max(candidates, key=lambda x: len(x.original_text))
+        if pattern == SenryuPattern.STANDARD:
+            return 2
+        if pattern in _JIAMARI_PATTERNS:
+            return 1
+        return 0
 
     # カスタマイズ用メソッド
     def add_filter(self, filter_instance: Any) -> None:
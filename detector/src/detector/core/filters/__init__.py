@@ -1,6 +1,6 @@
 """川柳検知のフィルタリング層。."""
 
-from .base import BaseFilter, CandidateFilter
+from .base import AnyTokenFilter, BaseFilter, CandidateFilter, MoraTotalFilter, TokenFilter
 from .chain import FilterChain
 from .japanese import JapaneseCharacterFilter, MinimumTokenCountFilter
 from .punctuation import PunctuationBoundaryFilter, SymbolFilter
@@ -10,6 +10,9 @@ from .unknown_word import MoraCountFilter, UnknownWordFilter
 __all__ = [
     "BaseFilter",
     "CandidateFilter",
+    "TokenFilter",
+    "MoraTotalFilter",
+    "AnyTokenFilter",
     "FilterChain",
     "JapaneseCharacterFilter",
     "MinimumTokenCountFilter",
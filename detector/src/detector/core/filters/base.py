@@ -42,6 +42,102 @@ class CandidateFilter(BaseFilter):
     """
 
 
+class TokenFilter(CandidateFilter):
+    """トークン単位で判定できるフィルタのベースクラス。.
+
+    候補内のすべてのトークンが条件を満たす場合に通過する。判定がトークンごとに
+    独立しているため、テキスト全体で一度だけ判定して候補の探索範囲を絞り込める。
+    """
+
+    @abstractmethod
+    def accepts_token(self, token: Token) -> bool:
+        """トークンが条件を満たすかどうかを判定。.
+
+        Args:
+            token: 判定対象のトークン
+
+        Returns:
+            条件を満たす場合True、候補から除外すべきトークンの場合False
+        """
+
+    def apply(self, tokens: TokenList, **kwargs: object) -> bool:
+        """すべてのトークンが条件を満たすかチェック。.
+
+        Args:
+            tokens: チェックするトークンリスト
+            **kwargs: 未使用
+
+        Returns:
+            すべてのトークンが条件を満たす場合True
+        """
+        for token in tokens:
+            if not self.accepts_token(token):
+                return False
+        return True
+
+
+class MoraTotalFilter(CandidateFilter):
+    """候補の総モーラ数のみで判定できるフィルタのベースクラス。.
+
+    判定が総モーラ数だけに依存するため、累積モーラ数の配列があれば
+    候補ごとにトークンを走査せずに判定できる。
+    """
+
+    @abstractmethod
+    def accepts_total(self, total_mora: int) -> bool:
+        """総モーラ数が条件を満たすかどうかを判定。.
+
+        Args:
+            total_mora: 候補の総モーラ数
+
+        Returns:
+            条件を満たす場合True
+        """
+
+    def apply(self, tokens: TokenList, **kwargs: object) -> bool:
+        """トークンリストの総モーラ数が条件を満たすかチェック。.
+
+        Args:
+            tokens: チェックするトークンリスト
+            **kwargs: 未使用
+
+        Returns:
+            総モーラ数が条件を満たす場合True
+        """
+        return self.accepts_total(sum(token.mora_count for token in tokens))
+
+
+class AnyTokenFilter(CandidateFilter):
+    """いずれかのトークンが条件を満たす候補のみを通すフィルタのベースクラス。.
+
+    判定がトークンごとに独立しているため、条件を満たすトークンの位置を
+    テキスト全体で一度だけ求めれば、候補ごとにトークンを走査せずに判定できる。
+    """
+
+    @abstractmethod
+    def matches_token(self, token: Token) -> bool:
+        """トークンが条件を満たすかどうかを判定。.
+
+        Args:
+            token: 判定対象のトークン
+
+        Returns:
+            条件を満たす場合True
+        """
+
+    def apply(self, tokens: TokenList, **kwargs: object) -> bool:
+        """いずれかのトークンが条件を満たすかチェック。.
+
+        Args:
+            tokens: チェックするトークンリスト
+            **kwargs: 未使用
+
+        Returns:
+            条件を満たすトークンを含む場合True
+        """
+        return any(self.matches_token(token) for token in tokens)
+
+
 class CompositeFilter(BaseFilter):
     """複数のフィルタを組み合わせるコンポジットフィルタ。."""
 
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator, Sequence
 
-from .base import BaseFilter, TokenList
+from .base import AnyTokenFilter, BaseFilter, MoraTotalFilter, TokenFilter, TokenList
 
 
 class FilterChain:
@@ -53,9 +53,10 @@ class FilterChain:
         Returns:
             フィルタを通過したトークンリストのリスト
         """
+        applies = self._bind_applies(self.filters)
         filtered_lists = []
         for tokens in token_lists:
-            if self._should_pass(tokens):
+            if self._should_pass(tokens, applies):
                 filtered_lists.append(tokens)
         return filtered_lists
 
@@ -68,21 +69,144 @@ class FilterChain:
         Yields:
             フィルタを通過したトークンリスト
         """
+        applies = self._bind_applies(self.filters)
+
         for tokens in candidates_iter:
-            if self._should_pass(tokens):
+            if self._should_pass(tokens, applies):
                 yield tokens
 
-    def _should_pass(self, tokens: TokenList) -> bool:
+    def filter_spans(
+        self,
+        tokens: TokenList,
+        spans_iter: Iterator[tuple[int, int]],
+        skip_token_filters: bool = False,
+        cumulative_mora: list[int] | None = None,
+    ) -> Iterator[tuple[int, int]]:
+        """トークン位置の区間で表した候補をフィルタリング。.
+
+        Args:
+            tokens: テキスト全体のトークンリスト
+            spans_iter: 候補の区間[start, end)の反復子
+            skip_token_filters: Trueの場合、TokenFilterを適用しない
+                （find_next_rejected で事前に除外済みの候補に使用する）
+            cumulative_mora: テキスト全体の累積モーラ数（先頭からi番目のトークン直前までの
+                合計をi番目に持つ）。指定した場合、MoraTotalFilterは候補を走査せずに
+                累積モーラ数の差で判定する
+
+        Yields:
+            フィルタを通過した候補の区間
+        """
+        filters = self.filters
+        if skip_token_filters:
+            filters = [f for f in filters if not isinstance(f, TokenFilter)]
+
+        # AnyTokenFilterはテキスト全体で一度だけ求めた位置情報で判定する
+        any_filters = [f for f in filters if isinstance(f, AnyTokenFilter)]
+        next_matched = self.find_next_matched(tokens, any_filters)
+        filters = [f for f in filters if not isinstance(f, AnyTokenFilter)]
+
+        # MoraTotalFilterは累積モーラ数がある場合にその差で判定する
+        accepts_totals: tuple[Callable[[int], bool], ...] = ()
+        if cumulative_mora is not None:
+            accepts_totals = tuple(
+                f.accepts_total for f in filters if isinstance(f, MoraTotalFilter)
+            )
+            filters = [f for f in filters if not isinstance(f, MoraTotalFilter)]
+        applies = self._bind_applies(filters)
+
+        for start, end in spans_iter:
+            if next_matched[start] >= end:
+                continue
+            if cumulative_mora is not None:
+                total_mora = cumulative_mora[end] - cumulative_mora[start]
+                if not all(accepts_total(total_mora) for accepts_total in accepts_totals):
+                    continue
+            if self._should_pass(tokens[start:end], applies):
+                yield start, end
+
+    def find_next_rejected(self, tokens: TokenList) -> list[int]:
+        """各位置以降で最初にTokenFilterに除外されるトークンの位置を計算。.
+
+        右から左への一度の走査で求める。区間[start, end)の候補は
+        結果のstart番目の値がend未満の場合に除外される。
+
+        Args:
+            tokens: テキスト全体のトークンリスト
+
+        Returns:
+            長さlen(tokens) + 1のリスト（除外されるトークンがない場合はlen(tokens)）
+        """
+        token_filters = [filter_ for filter_ in self.filters if isinstance(filter_, TokenFilter)]
+        next_rejected = [len(tokens)] * (len(tokens) + 1)
+
+        for i in range(len(tokens) - 1, -1, -1):
+            token = tokens[i]
+            if any(not filter_.accepts_token(token) for filter_ in token_filters):
+                next_rejected[i] = i
+            else:
+                next_rejected[i] = next_rejected[i + 1]
+
+        return next_rejected
+
+    def find_next_matched(self, tokens: TokenList, any_filters: list[AnyTokenFilter]) -> list[int]:
+        """各位置以降ですべてのAnyTokenFilterの条件が満たされる最初の位置を計算。.
+
+        フィルタごとに右から左への一度の走査で条件を満たす次のトークンの位置を求め、
+        その最大値を取る。区間[start, end)の候補は結果のstart番目の値がend以上の
+        場合に除外される。
+
+        Args:
+            tokens: テキスト全体のトークンリスト
+            any_filters: 判定するAnyTokenFilterのリスト
+
+        Returns:
+            長さlen(tokens) + 1のリスト（条件を満たすトークンがない場合はlen(tokens)）
+        """
+        next_matched = [0] * (len(tokens) + 1)
+
+        for filter_ in any_filters:
+            next_match = len(tokens)
+            for i in range(len(tokens) - 1, -1, -1):
+                if filter_.matches_token(tokens[i]):
+                    next_match = i
+                if next_match > next_matched[i]:
+                    next_matched[i] = next_match
+            next_matched[len(tokens)] = len(tokens)
+
+        return next_matched
+
+    @staticmethod
+    def _bind_applies(filters: list[BaseFilter]) -> tuple[Callable[[TokenList], bool], ...]:
+        """フィルタのapplyメソッドを束縛済みメソッドのタプルとして取得。.
+
+        候補ごとの属性参照を避けるため、フィルタリングの開始時に一度だけ呼び出す。
+
+        Args:
+            filters: 適用するフィルタのリスト
+
+        Returns:
+            各フィルタのapplyメソッドのタプル
+        """
+        return tuple(filter_.apply for filter_ in filters)
+
+    def _should_pass(
+        self,
+        tokens: TokenList,
+        applies: Sequence[Callable[[TokenList], bool]] | None = None,
+    ) -> bool:
         """トークンリストがすべてのフィルタを通過するかチェック。.
 
         Args:
             tokens: チェックするトークンリスト
+            applies: 適用するフィルタのapplyメソッド（省略時はチェーンのすべてのフィルタ）
 
         Returns:
             すべてのフィルタを通過する場合True
         """
-        for filter_ in self.filters:
-            if not filter_.apply(tokens):
+        if applies is None:
+            applies = self._bind_applies(self.filters)
+        for apply in applies:
+            if not apply(tokens):
                 return False
         return True
 
@@ -2,32 +2,28 @@
 
 from __future__ import annotations
 
-from .base import CandidateFilter, TokenList
+from ...models.senryu import Token
+from ..mora import JAPANESE_CHAR_PATTERN
+from .base import AnyTokenFilter, CandidateFilter, TokenList
 
 
-class JapaneseCharacterFilter(CandidateFilter):
+class JapaneseCharacterFilter(AnyTokenFilter):
     """日本語文字を含むトークンリストのみを通すフィルタ。.
 
     川柳検知の対象として、日本語文字（ひらがな、カタカナ、漢字）を
     含むトークンリストのみを許可する。
     """
 
-    def apply(self, tokens: TokenList, **kwargs: object) -> bool:
-        """トークンリストが日本語文字を含むかチェック。.
+    def matches_token(self, token: Token) -> bool:
+        """トークンの表層形が日本語文字を含むかチェック。.
 
         Args:
-            tokens: チェックするトークンリスト
-            **kwargs: 未使用
+            token: チェックするトークン
 
         Returns:
             日本語文字を含む場合True
         """
-        if not tokens:
-            return False
-
-        # 全トークンの表層形を結合して日本語文字をチェック
-        combined_text = "".join(token.surface for token in tokens)
-        return self._contains_japanese(combined_text)
+        return self._contains_japanese(token.surface)
 
     def _contains_japanese(self, text: str) -> bool:
         """テキストが日本語文字を含むかどうかをチェック。.
@@ -38,16 +34,7 @@ class JapaneseCharacterFilter(CandidateFilter):
         Returns:
             日本語文字を含む場合True
         """
-        for char in text:
-            # ひらがな、カタカナ、CJK統合漢字を含む場合は日本語とみなす
-            if (
-                "\u3040" <= char <= "\u309f"  # ひらがな
-                or "\u30a0" <= char <= "\u30ff"  # カタカナ
-                or "\u4e00" <= char <= "\u9fff"  # CJK統合漢字
-                or "\u3400" <= char <= "\u4dbf"  # CJK拡張A
-            ):
-                return True
-        return False
+        return JAPANESE_CHAR_PATTERN.search(text) is not None
 
 
 class MinimumTokenCountFilter(CandidateFilter):
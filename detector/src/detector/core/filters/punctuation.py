@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from .base import CandidateFilter, TokenList
+from ...models.senryu import Token
+from .base import TokenFilter
 
 
-class PunctuationBoundaryFilter(CandidateFilter):
+class PunctuationBoundaryFilter(TokenFilter):
     """句読点などの文境界記号を含むトークンリストを除外するフィルタ。.
 
     川柳は通常単一の文として構成されるため、句点や感嘆符などの
@@ -20,20 +21,16 @@ class PunctuationBoundaryFilter(CandidateFilter):
         """
         self.boundary_marks = boundary_marks or {"。", "！", "？", "!", "?"}
 
-    def apply(self, tokens: TokenList, **kwargs: object) -> bool:
-        """トークンリストに文境界記号が含まれていないかチェック。.
+    def accepts_token(self, token: Token) -> bool:
+        """トークンが文境界記号でないかチェック。.
 
         Args:
-            tokens: チェックするトークンリスト
-            **kwargs: 未使用
+            token: チェックするトークン
 
         Returns:
-            文境界記号が含まれていない場合True
+            文境界記号でない場合True
         """
-        for token in tokens:
-            if token.surface in self.boundary_marks:
-                return False
-        return True
+        return token.surface not in self.boundary_marks
 
     def add_boundary_mark(self, mark: str) -> None:
         """境界記号を追加。.
@@ -58,7 +55,7 @@ class PunctuationBoundaryFilter(CandidateFilter):
         return False
 
 
-class SymbolFilter(CandidateFilter):
+class SymbolFilter(TokenFilter):
     """特定の記号を含むトークンリストをフィルタリング。.
 
     補助記号や特殊文字を含む候補を処理するためのフィルタ。
@@ -78,20 +75,14 @@ class SymbolFilter(CandidateFilter):
         self.allowed_symbols = allowed_symbols or set()
         self.exclude_pos = exclude_pos or {"補助記号", "空白"}
 
-    def apply(self, tokens: TokenList, **kwargs: object) -> bool:
+    def accepts_token(self, token: Token) -> bool:
         """記号に関するフィルタリングルールを適用。.
 
         Args:
-            tokens: チェックするトークンリスト
-            **kwargs: 未使用
+            token: チェックするトークン
 
         Returns:
             フィルタを通過する場合True
         """
-        for token in tokens:
-            # 除外品詞のトークンがある場合
-            if token.pos in self.exclude_pos:
-                # 許可記号でない場合は除外
-                if token.surface not in self.allowed_symbols:
-                    return False
-        return True
+        # 除外品詞のトークンは許可記号の場合のみ通過
+        return token.pos not in self.exclude_pos or token.surface in self.allowed_symbols
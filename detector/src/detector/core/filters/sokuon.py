@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from ...models.senryu import Token
 from .base import CandidateFilter
@@ -12,6 +12,33 @@ if TYPE_CHECKING:
 
 type TokenList = list[Token]
 
+# 「っ」の後に続いてよい記号的な品詞
+_SYMBOL_POS: Final[frozenset[str]] = frozenset({"補助記号", "記号", "句読点"})
+
+# 句末に来ても問題ない記号類（いずれも1文字）
+_ALLOWED_ENDINGS: Final[frozenset[str]] = frozenset(
+    {
+        "。",
+        "！",
+        "？",
+        "!",
+        "?",
+        ".",
+        "…",
+        "・",
+        "」",
+        "』",
+        "）",
+        "〉",
+        "》",
+        "、",
+        ",",
+        "；",
+        ";",
+        "：",
+    }
+)
+
 
 class SokuonEndingFilter(CandidateFilter):
     """句が「っ」で終わることを防ぐフィルター。.
@@ -22,27 +49,7 @@ class SokuonEndingFilter(CandidateFilter):
 
     def __init__(self) -> None:
         """促音終了フィルターを初期化。."""
-        # 句末に来ても問題ない記号類
-        self.allowed_endings = {
-            "。",
-            "！",
-            "？",
-            "!",
-            "?",
-            ".",
-            "…",
-            "・",
-            "」",
-            "』",
-            "）",
-            "〉",
-            "》",
-            "、",
-            ",",
-            "；",
-            ";",
-            "：",
-        }
+        self.allowed_endings = _ALLOWED_ENDINGS
 
     def apply(self, tokens: TokenList, **kwargs: object) -> bool:
         """フィルターを適用。.
@@ -103,18 +110,19 @@ class SokuonEndingFilter(CandidateFilter):
             記号が続いている場合True
         """
         last_token = phrase_tokens[-1]
+        surface = last_token.surface
 
         # トークンが「っ」以外の文字も含む場合（例：「です。」「った！」）
-        if len(last_token.surface) > 1 and last_token.surface.endswith("っ"):
+        if len(surface) > 1 and surface.endswith("っ"):
             return False
 
         # 表層形全体が「っ」の場合、読みや品詞から判定
-        # 記号的なトークンの場合は許可
-        if any(symbol in last_token.surface for symbol in self.allowed_endings):
+        # 記号的なトークンの場合は許可（許可記号はいずれも1文字なので文字単位で判定する）
+        if any(char in self.allowed_endings for char in surface):
             return True
 
         # 補助記号の品詞の場合は許可
-        if last_token.pos in ["補助記号", "記号", "句読点"]:
+        if last_token.pos in _SYMBOL_POS:
             return True
 
         return False
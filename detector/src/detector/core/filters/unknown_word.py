@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-from typing import Any
+import re
+from typing import Any, Final
 
-from .base import CandidateFilter, TokenList
+from ...models.senryu import Token
+from .base import MoraTotalFilter, TokenFilter
 
+# ASCII英数字
+_ASCII_ALNUM_PATTERN: Final[re.Pattern[str]] = re.compile(r"[0-9A-Za-z]")
 
-class UnknownWordFilter(CandidateFilter):
+
+class UnknownWordFilter(TokenFilter):
     """未知語を含むトークンリストを除外するフィルタ。.
 
     形態素解析で適切に処理されなかった未知語を含む候補を除外し、
@@ -28,20 +33,16 @@ class UnknownWordFilter(CandidateFilter):
         self.strict = strict
         self.allowed_pos = allowed_pos or {"補助記号", "空白"}
 
-    def apply(self, tokens: TokenList, **kwargs: object) -> bool:
-        """トークンリストに未知語が含まれていないかチェック。.
+    def accepts_token(self, token: Token) -> bool:
+        """トークンが未知語でないかチェック。.
 
         Args:
-            tokens: チェックするトークンリスト
-            **kwargs: 未使用
+            token: チェックするトークン
 
         Returns:
-            未知語が含まれていない場合True
+            未知語でない場合True
         """
-        for token in tokens:
-            if self._is_unknown_word(token):
-                return False
-        return True
+        return not self._is_unknown_word(token)
 
     def _is_unknown_word(self, token: Any) -> bool:
         """トークンが未知語かどうかを判定。.
@@ -75,10 +76,10 @@ class UnknownWordFilter(CandidateFilter):
         Returns:
             ASCII英数字が含まれている場合True
         """
-        return any(c.isalnum() and ord(c) < 128 for c in text)
+        return _ASCII_ALNUM_PATTERN.search(text) is not None
 
 
-class MoraCountFilter(CandidateFilter):
+class MoraCountFilter(MoraTotalFilter):
     """モーラ数に基づくフィルタ。.
 
     総モーラ数が川柳として適切な範囲にあるトークンリストのみを通す。
@@ -100,15 +101,13 @@ class MoraCountFilter(CandidateFilter):
         self.min_mora = min_mora - tolerance
         self.max_mora = max_mora + tolerance
 
-    def apply(self, tokens: TokenList, **kwargs: object) -> bool:
-        """トークンリストの総モーラ数が範囲内かチェック。.
+    def accepts_total(self, total_mora: int) -> bool:
+        """総モーラ数が範囲内かチェック。.
 
         Args:
-            tokens: チェックするトークンリスト
-            **kwargs: 未使用
+            total_mora: 候補の総モーラ数
 
         Returns:
             総モーラ数が範囲内の場合True
         """
-        total_mora = sum(token.mora_count for token in tokens)
         return self.min_mora <= total_mora <= self.max_mora
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Final
 
 # 拗音（ゃゅょ等）- モーラとしてカウントしない
@@ -18,6 +19,30 @@ LONG_VOWEL_PATTERN: Final[re.Pattern[str]] = re.compile(r"ー")
 HIRAGANA_PATTERN: Final[re.Pattern[str]] = re.compile(r"[あ-ん]")
 KATAKANA_PATTERN: Final[re.Pattern[str]] = re.compile(r"[ア-ン]")
 
+# 日本語文字（ひらがな、カタカナ、CJK統合漢字、CJK拡張A）
+JAPANESE_CHAR_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"[\u3040-\u309f\u30a0-\u30ff\u4e00-\u9fff\u3400-\u4dbf]"
+)
+
+# 読みごとの計算結果のキャッシュ上限（助詞など同じ読みが頻出するため）
+READING_CACHE_SIZE: Final[int] = 4096
+
+# 1文字の判定に使う文字集合（判定関数で正規表現エンジンを介さないため）
+_YOUON_CHARS: Final[frozenset[str]] = frozenset("ゃゅょャュョ")
+_SOKUON_CHARS: Final[frozenset[str]] = frozenset("っッ")
+
+# モーラとしてカウントする文字（ひらがな・カタカナの基本文字と長音記号、拗音は除く）
+_MORA_CHARS: Final[frozenset[str]] = (
+    frozenset(chr(code) for code in range(ord("あ"), ord("ん") + 1))
+    | frozenset(chr(code) for code in range(ord("ア"), ord("ン") + 1))
+    | {"ー"}
+) - _YOUON_CHARS
+
+# カタカナ（ア〜ン）からひらがなへの変換表（str.translate 用）
+_KATAKANA_TO_HIRAGANA: Final[dict[int, int]] = {
+    code: code - (ord("ア") - ord("あ")) for code in range(ord("ア"), ord("ン") + 1)
+}
+
 
 def is_youon(char: str) -> bool:
     """文字がゃゅょのような拗音かどうかをチェック。.
@@ -28,7 +53,8 @@ def is_youon(char: str) -> bool:
     Returns:
         拗音の場合はTrue、そうでなければFalse
     """
-    return bool(YOUON_PATTERN.match(char))
+    # YOUON_PATTERN.match と同様に先頭の文字で判定する
+    return char[:1] in _YOUON_CHARS
 
 
 def is_special_mora(char: str) -> bool:
@@ -40,7 +66,7 @@ def is_special_mora(char: str) -> bool:
     Returns:
         促音の場合はTrue、そうでなければFalse
     """
-    return bool(SOKUON_PATTERN.match(char))
+    return char[:1] in _SOKUON_CHARS
 
 
 def is_long_vowel(char: str) -> bool:
@@ -52,7 +78,7 @@ def is_long_vowel(char: str) -> bool:
     Returns:
         長音記号の場合はTrue、そうでなければFalse
     """
-    return bool(LONG_VOWEL_PATTERN.match(char))
+    return char.startswith("ー")
 
 
 def is_japanese_mora_char(char: str) -> bool:
@@ -64,9 +90,11 @@ def is_japanese_mora_char(char: str) -> bool:
     Returns:
         モーラとしてカウントできる場合はTrue
     """
-    return bool(HIRAGANA_PATTERN.match(char) or KATAKANA_PATTERN.match(char) or is_long_vowel(char))
+    first = char[:1]
+    return "あ" <= first <= "ん" or "ア" <= first <= "ン" or first == "ー"
 
 
+@lru_cache(maxsize=READING_CACHE_SIZE)
 def count_mora(text: str) -> int:
     """日本語テキストのモーラ数をカウント。.
 
@@ -95,55 +123,45 @@ def count_mora(text: str) -> int:
     if not text:
         return 0
 
-    mora_count = 0
-    i = 0
+    # 拗音は前の文字と組み合わせて1モーラとなるため、カウント対象の集合から除外済み
+    return sum(map(_MORA_CHARS.__contains__, text))
 
-    while i < len(text):
-        char = text[i]
 
-        if is_japanese_mora_char(char):
-            if is_youon(char):
-                # 拗音は前の文字と組み合わせて1モーラ
-                # ただし、前の文字がない場合や日本語文字でない場合は0モーラ
-                if i == 0 or not is_japanese_mora_char(text[i - 1]) or is_youon(text[i - 1]):
-                    # 独立した拗音は0モーラ（異常ケース）
-                    pass
-                else:
-                    # 前の文字と組み合わせ済みなので、追加のカウントは不要
-                    pass
-            else:
-                # 基本的な文字は1モーラ
-                mora_count += 1
+@lru_cache(maxsize=READING_CACHE_SIZE)
+def normalize_reading(reading: str) -> str:
+    """一貫した処理のために読みをひらがなに正規化。.
 
-                # 次の文字が拗音の場合、組み合わせても1モーラのまま
-                if i + 1 < len(text) and is_youon(text[i + 1]):
-                    i += 1  # 拗音をスキップ
+    Args:
+        reading: カタカナまたはひらがなの読み
 
-        i += 1
+    Returns:
+        ひらがなに正規化された読み
+    """
+    if not reading:
+        return ""
 
-    return mora_count
+    # カタカナをひらがなに変換（文字ごとの連結を避け、変換表で一括変換する）
+    return reading.translate(_KATAKANA_TO_HIRAGANA)
 
 
-def normalize_reading(reading: str) -> str:
-    """一貫した処理のために読みをひらがなに正規化。.
+@lru_cache(maxsize=READING_CACHE_SIZE)
+def count_and_normalize(reading: str) -> tuple[str, int]:
+    """読みのひらがな正規化とモーラ数のカウントを行う。.
+
+    normalize_reading と count_mora を続けて呼ぶのと同じ結果を返す。
+    カタカナからひらがなへの変換ではモーラの扱いが変わらないため、変換と
+    カウントはそれぞれC実装の一括処理で行う。
 
     Args:
         reading: カタカナまたはひらがなの読み
 
     Returns:
-        ひらがなに正規化された読み
+        ひらがなに正規化された読みとモーラ数のタプル
     """
     if not reading:
-        return ""
+        return "", 0
 
-    # カタカナをひらがなに変換
-    normalized = ""
-    for char in reading:
-        if "ア" <= char <= "ン":
-            # カタカナをひらがなに変換
-            hiragana_char = chr(ord(char) - ord("ア") + ord("あ"))
-            normalized += hiragana_char
-        else:
-            normalized += char
-
-    return normalized
+    return (
+        reading.translate(_KATAKANA_TO_HIRAGANA),
+        sum(map(_MORA_CHARS.__contains__, reading)),
+    )
@@ -14,6 +14,28 @@ SENRYU_PATTERNS: Final[dict[SenryuPattern, tuple[int, int, int]]] = {
     SenryuPattern.JIAMARI_3: (5, 7, 6),  # 字余り川柳（下句6音）
 }
 
+# 有効なモーラパターンの集合（候補ごとの判定をハッシュ参照で行うため）
+_VALID_MORA_PATTERNS: Final[frozenset[tuple[int, int, int]]] = frozenset(SENRYU_PATTERNS.values())
+
+# モーラパターンからパターンタイプへの逆引き表
+_PATTERN_TYPES: Final[dict[tuple[int, int, int], SenryuPattern]] = {
+    mora_pattern: pattern for pattern, mora_pattern in SENRYU_PATTERNS.items()
+}
+
+# 句の開始として厳密には不適切な品詞
+_STRICT_INVALID_START_POS: Final[frozenset[str]] = frozenset(
+    {
+        "助詞",  # が、を、に、で等の格助詞
+        "助動詞",  # だ、である等
+        "接続助詞",  # ので、から等
+        "補助記号",  # 句読点等
+        "接続詞",  # しかし、そして等
+    }
+)
+
+# 有効な川柳が取り得る総モーラ数の集合
+VALID_MORA_TOTALS: Final[frozenset[int]] = frozenset(sum(p) for p in SENRYU_PATTERNS.values())
+
 
 def is_valid_senryu_pattern(mora_pattern: tuple[int, int, int]) -> bool:
     """モーラパターンが有効な川柳パターンとマッチするかどうかをチェック。.
@@ -24,7 +46,7 @@ def is_valid_senryu_pattern(mora_pattern: tuple[int, int, int]) -> bool:
     Returns:
         有効な川柳パターンとマッチする場合はTrue
     """
-    return mora_pattern in SENRYU_PATTERNS.values()
+    return mora_pattern in _VALID_MORA_PATTERNS
 
 
 def get_pattern_type(mora_pattern: tuple[int, int, int]) -> SenryuPattern | None:
@@ -36,10 +58,7 @@ def get_pattern_type(mora_pattern: tuple[int, int, int]) -> SenryuPattern | None
     Returns:
         有効な場合はSenryuPattern、そうでなければNone
     """
-    for pattern, pattern_mora in SENRYU_PATTERNS.items():
-        if mora_pattern == pattern_mora:
-            return pattern
-    return None
+    return _PATTERN_TYPES.get(mora_pattern)
 
 
 def validate_senryu_rules(
@@ -88,15 +107,7 @@ def _is_valid_phrase_start_strict(token: Token) -> bool:
         有効な開始品詞の場合True
     """
     # 明らかに不適切な品詞のみ禁止
-    invalid_starts = {
-        "助詞",  # が、を、に、で等の格助詞
-        "助動詞",  # だ、である等
-        "接続助詞",  # ので、から等
-        "補助記号",  # 句読点等
-        "接続詞",  # しかし、そして等
-    }
-
-    return token.pos not in invalid_starts
+    return token.pos not in _STRICT_INVALID_START_POS
 
 
 def get_target_patterns() -> list[tuple[int, int, int]]:
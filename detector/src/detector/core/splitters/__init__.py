@@ -9,6 +9,7 @@ from .scorer import (
     CompositeScorer,
     MoraScorer,
     SemanticScorer,
+    TokenArrays,
 )
 
 __all__ = [
@@ -25,4 +26,5 @@ __all__ = [
     "BoundaryScorer",
     "SemanticScorer",
     "CompositeScorer",
+    "TokenArrays",
 ]
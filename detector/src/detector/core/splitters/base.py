@@ -4,8 +4,10 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import cached_property
 
 from ...models.senryu import Token
+from .scorer import TokenArrays
 
 type TokenList = list[Token]
 type SplitTuple = tuple[TokenList, TokenList, TokenList]
@@ -21,9 +23,12 @@ class SplitResult:
     score: float
     metadata: dict[str, object] | None = None
 
-    @property
+    @cached_property
     def mora_pattern(self) -> tuple[int, int, int]:
-        """モーラパターンを取得。."""
+        """モーラパターンを取得。.
+
+        句のトークンは変更されないため、初回の参照時に一度だけ計算する。
+        """
         return (
             sum(token.mora_count for token in self.upper_tokens),
             sum(token.mora_count for token in self.middle_tokens),
@@ -62,6 +67,25 @@ class BaseSplitter(ABC):
             最適な分割結果、適切な分割がない場合はNone
         """
 
+    def split_arrays(
+        self,
+        arrays: TokenArrays,
+        target_pattern: tuple[int, int, int],
+    ) -> SplitResult | None:
+        """事前計算済みのトークン配列を3つの句に分割。.
+
+        同じ候補を複数のパターンや分割器で分割する場合に、配列の構築を一度で
+        済ませるために使用する。デフォルトではsplitに委譲する。
+
+        Args:
+            arrays: 分割対象のトークン配列
+            target_pattern: 目標モーラパターン
+
+        Returns:
+            最適な分割結果、適切な分割がない場合はNone
+        """
+        return self.split(arrays.tokens, target_pattern)
+
     def can_split(self, tokens: TokenList) -> bool:
         """分割可能かどうかを事前チェック。.
 
@@ -96,6 +120,22 @@ class CompositeSplitter(BaseSplitter):
             tokens: 分割対象のトークンリスト
             target_pattern: 目標モーラパターン
 
+        Returns:
+            最適な分割結果
+        """
+        return self.split_arrays(TokenArrays.from_tokens(tokens), target_pattern)
+
+    def split_arrays(
+        self,
+        arrays: TokenArrays,
+        target_pattern: tuple[int, int, int],
+    ) -> SplitResult | None:
+        """すべての分割器を事前計算済みの配列で試行し、最高スコアの結果を返す。.
+
+        Args:
+            arrays: 分割対象のトークン配列
+            target_pattern: 目標モーラパターン
+
         Returns:
             最適な分割結果
         """
@@ -103,10 +143,10 @@ class CompositeSplitter(BaseSplitter):
         best_score = float("-inf")
 
         for splitter in self.splitters:
-            if not splitter.can_split(tokens):
+            if not splitter.can_split(arrays.tokens):
                 continue
 
-            result = splitter.split(tokens, target_pattern)
+            result = splitter.split_arrays(arrays, target_pattern)
             if result and result.score > best_score:
                 best_score = result.score
                 best_result = result
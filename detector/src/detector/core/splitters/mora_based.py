@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import math
+from bisect import bisect_left, bisect_right
+from dataclasses import replace
+
 from .base import BaseSplitter, SplitResult, TokenList
-from .scorer import CompositeScorer, MoraScorer
+from .scorer import SCORE_BOUND_MARGIN, CompositeScorer, MoraScorer, TokenArrays
 
 
 class MoraBasedSplitter(BaseSplitter):
@@ -35,67 +39,97 @@ class MoraBasedSplitter(BaseSplitter):
         Returns:
             最適な分割結果、適切な分割がない場合はNone
         """
+        # 累積モーラ数などのトークン情報を配列として事前計算
+        return self.split_arrays(TokenArrays.from_tokens(tokens), target_pattern)
+
+    def split_arrays(
+        self,
+        arrays: TokenArrays,
+        target_pattern: tuple[int, int, int],
+    ) -> SplitResult | None:
+        """事前計算済みのトークン配列をモーラ数ベースで分割。.
+
+        Args:
+            arrays: 分割対象のトークン配列
+            target_pattern: 目標モーラパターン
+
+        Returns:
+            最適な分割結果、適切な分割がない場合はNone
+        """
+        tokens = arrays.tokens
         if not self.can_split(tokens):
             return None
 
         # 総モーラ数の事前チェック
-        total_mora = sum(token.mora_count for token in tokens)
+        total_mora = arrays.cumulative_mora[-1]
         target_total = sum(target_pattern)
 
         if abs(total_mora - target_total) > self.tolerance:
             return None
 
-        # 累積モーラ数配列を作成
-        self._calculate_cumulative_mora(tokens)
-
-        best_split = None
         best_score = float("-inf")
-
-        # 単語境界でのみ分割を試行
-        for i in range(1, len(tokens)):
-            for j in range(i + 1, len(tokens)):
-                upper_tokens = tokens[:i]
-                middle_tokens = tokens[i:j]
-                lower_tokens = tokens[j:]
-
-                # 空の句は除外
-                if not upper_tokens or not middle_tokens or not lower_tokens:
-                    continue
-
+        best_i = best_j = 0
+
+        # スコアの上限 bonus - penalty_weight * (モーラ数の差異の合計) から、閾値を満たす分割で
+        # 上句・中句の差異がそれぞれ取りうる最大値を求める。累積モーラ数は減少しないため、
+        # その範囲の分割位置を二分探索で求めて走査する（範囲外の分割は閾値を満たさない）
+        # 上限が不明な場合はすべての分割位置を走査する
+        cumulative = arrays.cumulative_mora
+        upper_target, middle_target, _ = target_pattern
+        n = len(tokens)
+        radius = self._max_phrase_penalty(arrays)
+
+        # 単語境界でのみ分割を試行（1 <= i < j < len(tokens) のため空の句は生じない）
+        # ループ内では最良の分割位置のみを保持し、分割結果は最後に一度だけ作成する
+        if radius is None:
+            i_first, i_last = 1, n
+        else:
+            i_first = bisect_left(cumulative, upper_target - radius, 1, n)
+            i_last = bisect_right(cumulative, upper_target + radius, i_first, n)
+        for i in range(i_first, i_last):
+            if radius is None:
+                j_first, j_last = i + 1, n
+            else:
+                middle_end = cumulative[i] + middle_target
+                j_first = bisect_left(cumulative, middle_end - radius, i + 1, n)
+                j_last = bisect_right(cumulative, middle_end + radius, j_first, n)
+            for j in range(j_first, j_last):
                 # スコア計算
-                score = self.scorer.calculate_score(
-                    upper_tokens, middle_tokens, lower_tokens, target_pattern
-                )
+                score = self.scorer.calculate_split_score(arrays, i, j, target_pattern)
 
                 if score > best_score:
                     best_score = score
-                    best_split = SplitResult(
-                        upper_tokens=upper_tokens,
-                        middle_tokens=middle_tokens,
-                        lower_tokens=lower_tokens,
-                        score=score,
-                        metadata={"splitter": "mora_based", "tolerance": self.tolerance},
-                    )
+                    best_i, best_j = i, j
 
         # スコア閾値チェック
-        if best_split and best_split.score >= -self.tolerance:
-            return best_split
+        if best_i and best_score >= -self.tolerance:
+            return SplitResult(
+                upper_tokens=tokens[:best_i],
+                middle_tokens=tokens[best_i:best_j],
+                lower_tokens=tokens[best_j:],
+                score=best_score,
+                metadata={"splitter": "mora_based", "tolerance": self.tolerance},
+            )
 
         return None
 
-    def _calculate_cumulative_mora(self, tokens: TokenList) -> list[int]:
-        """累積モーラ数配列を計算。.
+    def _max_phrase_penalty(self, arrays: TokenArrays) -> int | None:
+        """閾値を満たす分割で1つの句のモーラ数の差異が取りうる最大値を計算。.
 
         Args:
-            tokens: トークンリスト
+            arrays: 分割対象のトークン配列
 
         Returns:
-            累積モーラ数のリスト
+            差異の最大値、スコアの上限が不明またはモーラ数の差異に依存しない場合はNone
         """
-        cumulative = [0]
-        for token in tokens:
-            cumulative.append(cumulative[-1] + token.mora_count)
-        return cumulative
+        bound = self.scorer.split_score_bound(arrays)
+        if bound is None:
+            return None
+        penalty_weight, bonus = bound
+        if penalty_weight <= 0:
+            return None
+        # bonus - penalty_weight * penalty >= -tolerance を満たす差異の最大値
+        return math.floor((bonus + self.tolerance) / penalty_weight + SCORE_BOUND_MARGIN)
 
     def can_split(self, tokens: TokenList) -> bool:
         """分割可能かどうかをチェック。.
@@ -134,37 +168,40 @@ class FlexibleMoraBasedSplitter(MoraBasedSplitter):
         self.base_tolerance = base_tolerance
         self.max_tolerance = max_tolerance
 
-    def split(
+    def split_arrays(
         self,
-        tokens: TokenList,
+        arrays: TokenArrays,
         target_pattern: tuple[int, int, int],
     ) -> SplitResult | None:
         """段階的に許容範囲を広げて分割を試行。.
 
+        閾値を満たす最良の分割は許容範囲によらず同じで、そのモーラ数の差異
+        （スコアの符号を反転したもの）以上の許容範囲で初めて見つかる。そのため
+        最大の許容範囲で一度だけ探索し、分割が見つかる最小の許容範囲を求める。
+
         Args:
-            tokens: 分割対象のトークンリスト
+            arrays: 分割対象のトークン配列
             target_pattern: 目標モーラパターン
 
         Returns:
             最適な分割結果
         """
-        # 段階的に許容範囲を広げて試行
-        for tolerance in range(self.base_tolerance, self.max_tolerance + 1):
-            self.tolerance = tolerance
-            result = super().split(tokens, target_pattern)
-            if result:
-                # メタデータを含む新しい結果を作成
-                updated_metadata = result.metadata or {}
-                updated_metadata["actual_tolerance"] = tolerance
-
-                from .base import SplitResult
-
-                return SplitResult(
-                    upper_tokens=result.upper_tokens,
-                    middle_tokens=result.middle_tokens,
-                    lower_tokens=result.lower_tokens,
-                    score=result.score,
-                    metadata=updated_metadata,
-                )
+        if self.base_tolerance > self.max_tolerance:
+            return None
 
-        return None
+        self.tolerance = self.max_tolerance
+        result = super().split_arrays(arrays, target_pattern)
+        if not result:
+            return None
+
+        tolerance = max(self.base_tolerance, math.ceil(-result.score))
+        self.tolerance = tolerance
+
+        # 結果ごとにメタデータは新規作成されるため、結果を作り直さずに更新する
+        metadata = result.metadata
+        if metadata is None:
+            metadata = {}
+            result = replace(result, metadata=metadata)
+        metadata["tolerance"] = tolerance
+        metadata["actual_tolerance"] = tolerance
+        return result
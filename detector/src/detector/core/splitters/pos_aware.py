@@ -2,10 +2,37 @@
 
 from __future__ import annotations
 
-from typing import Any
+import math
+from dataclasses import replace
+from typing import Final
 
 from .base import BaseSplitter, SplitResult, TokenList
-from .scorer import BoundaryScorer, CompositeScorer, MoraScorer, SemanticScorer
+from .scorer import (
+    SCORE_BOUND_MARGIN,
+    BoundaryScorer,
+    CompositeScorer,
+    MoraScorer,
+    SemanticScorer,
+    TokenArrays,
+    get_pos_id,
+)
+
+# 句の開始として明らかに不適切な品詞
+_INVALID_START_POS: Final[frozenset[str]] = frozenset(
+    {
+        "接続助詞",  # ので、から、けれど等
+        "接尾辞",  # ども、ら、たち等
+        "補助記号",  # 句読点等
+    }
+)
+
+# 句の開始として不適切な品詞のID（トークン配列の品詞IDで判定するため）
+_INVALID_START_POS_IDS: Final[frozenset[int]] = frozenset(map(get_pos_id, _INVALID_START_POS))
+
+# 中句・下句がともにこれらの品詞で始まる分割は意味的に不自然
+_PROBLEM_START_POS: Final[frozenset[str]] = frozenset({"助詞", "助動詞"})
+# 意味的妥当性の判定に使う品詞のID
+_PROBLEM_START_POS_IDS: Final[frozenset[int]] = frozenset(map(get_pos_id, _PROBLEM_START_POS))
 
 
 class POSAwareSplitter(BaseSplitter):
@@ -44,71 +71,100 @@ class POSAwareSplitter(BaseSplitter):
         Returns:
             最適な分割結果、適切な分割がない場合はNone
         """
+        # 分割位置ごとの句の切り出しを避けるため、トークン情報を配列として事前計算
+        return self.split_arrays(TokenArrays.from_tokens(tokens), target_pattern)
+
+    def split_arrays(
+        self,
+        arrays: TokenArrays,
+        target_pattern: tuple[int, int, int],
+    ) -> SplitResult | None:
+        """事前計算済みのトークン配列を品詞情報を考慮して分割。.
+
+        Args:
+            arrays: 分割対象のトークン配列
+            target_pattern: 目標モーラパターン
+
+        Returns:
+            最適な分割結果、適切な分割がない場合はNone
+        """
+        tokens = arrays.tokens
         if not self.can_split(tokens):
             return None
 
-        best_split = None
         best_score = float("-inf")
-
+        best_i = best_j = 0
+
+        # 句開始の妥当性は事前計算済みの品詞IDでトークンごとに一度だけ判定
+        invalid_start_ids = _INVALID_START_POS_IDS
+        valid_start = [pos_id not in invalid_start_ids for pos_id in arrays.pos_ids]
+
+        # スコアの上限が最良スコアに満たない分割位置はスコア計算を省略する
+        # （上限はモーラ数の差異が大きいほど低く、最良スコアは走査中に減少しない）
+        bound = self.scorer.split_score_bound(arrays)
+        penalty_weight, max_bonus = bound if bound is not None else (0.0, math.inf)
+        cumulative = arrays.cumulative_mora
+        total_mora = cumulative[-1]
+        upper_target, middle_target, lower_target = target_pattern
+
+        # 1 <= i < j < len(tokens) の範囲で走査するため空の句は生じない
+        # ループ内では最良の分割位置のみを保持し、分割結果は最後に一度だけ作成する
         for i in range(1, len(tokens)):
-            for j in range(i + 1, len(tokens)):
-                upper_tokens = tokens[:i]
-                middle_tokens = tokens[i:j]
-                lower_tokens = tokens[j:]
+            # 句開始の妥当性チェック
+            if not valid_start[i]:
+                continue
+
+            # 中句・下句の差異の合計は、残りのモーラ数と目標の差以上となる
+            upper_mora = cumulative[i]
+            rest_mora = total_mora - upper_mora
+            upper_penalty = abs(upper_mora - upper_target)
+            min_penalty = upper_penalty + abs(rest_mora - middle_target - lower_target)
+            if max_bonus - penalty_weight * min_penalty < best_score - SCORE_BOUND_MARGIN:
+                # 上句が目標以上で残りが目標以下なら、以降のiでも差異は減少しない
+                if upper_mora >= upper_target and rest_mora <= middle_target + lower_target:
+                    break
+                continue
 
-                # 空の句は除外
-                if not upper_tokens or not middle_tokens or not lower_tokens:
+            for j in range(i + 1, len(tokens)):
+                if not valid_start[j]:
                     continue
 
-                # 句開始の妥当性チェック
-                if not self._is_valid_phrase_start(middle_tokens[0]):
-                    continue
-                if not self._is_valid_phrase_start(lower_tokens[0]):
+                middle_mora = cumulative[j] - upper_mora
+                lower_mora = total_mora - cumulative[j]
+                penalty = (
+                    upper_penalty
+                    + abs(middle_mora - middle_target)
+                    + abs(lower_mora - lower_target)
+                )
+                if max_bonus - penalty_weight * penalty < best_score - SCORE_BOUND_MARGIN:
+                    # 中句が目標以上で下句が目標以下なら、以降のjでも差異は減少しない
+                    if middle_mora >= middle_target and lower_mora <= lower_target:
+                        break
                     continue
 
                 # スコア計算
-                score = self.scorer.calculate_score(
-                    upper_tokens, middle_tokens, lower_tokens, target_pattern
-                )
+                score = self.scorer.calculate_split_score(arrays, i, j, target_pattern)
 
                 if score > best_score:
                     best_score = score
-                    best_split = SplitResult(
-                        upper_tokens=upper_tokens,
-                        middle_tokens=middle_tokens,
-                        lower_tokens=lower_tokens,
-                        score=score,
-                        metadata={
-                            "splitter": "pos_aware",
-                            "mora_weight": self.mora_weight,
-                            "pos_weight": self.pos_weight,
-                        },
-                    )
+                    best_i, best_j = i, j
 
         # 最低スコア閾値をクリア
-        if best_split and best_split.score > -10.0:
-            return best_split
+        if best_i and best_score > -10.0:
+            return SplitResult(
+                upper_tokens=tokens[:best_i],
+                middle_tokens=tokens[best_i:best_j],
+                lower_tokens=tokens[best_j:],
+                score=best_score,
+                metadata={
+                    "splitter": "pos_aware",
+                    "mora_weight": self.mora_weight,
+                    "pos_weight": self.pos_weight,
+                },
+            )
 
         return None
 
-    def _is_valid_phrase_start(self, token: Any) -> bool:
-        """句の開始として適切な品詞かどうかを判定。.
-
-        Args:
-            token: 句の最初のトークン
-
-        Returns:
-            適切な開始品詞の場合True
-        """
-        # 句の開始として明らかに不適切な品詞のみを除外
-        invalid_starts = {
-            "接続助詞",  # ので、から、けれど等
-            "接尾辞",  # ども、ら、たち等
-            "補助記号",  # 句読点等
-        }
-
-        return token.pos not in invalid_starts
-
 
 class SemanticAwareSplitter(BaseSplitter):
     """意味的まとまりを考慮した句分割器。.
@@ -151,78 +207,93 @@ class SemanticAwareSplitter(BaseSplitter):
         Returns:
             最適な分割結果
         """
+        # 分割位置ごとの句の切り出しを避けるため、トークン情報を配列として事前計算
+        return self.split_arrays(TokenArrays.from_tokens(tokens), target_pattern)
+
+    def split_arrays(
+        self,
+        arrays: TokenArrays,
+        target_pattern: tuple[int, int, int],
+    ) -> SplitResult | None:
+        """事前計算済みのトークン配列を意味的まとまりを考慮して分割。.
+
+        Args:
+            arrays: 分割対象のトークン配列
+            target_pattern: 目標モーラパターン
+
+        Returns:
+            最適な分割結果
+        """
+        tokens = arrays.tokens
         if not self.can_split(tokens):
             return None
 
-        best_split = None
         best_score = float("-inf")
-
-        for i in range(1, len(tokens)):
-            for j in range(i + 1, len(tokens)):
-                upper_tokens = tokens[:i]
-                middle_tokens = tokens[i:j]
-                lower_tokens = tokens[j:]
-
-                # 空の句は除外
-                if not upper_tokens or not middle_tokens or not lower_tokens:
+        best_i = best_j = 0
+
+        # 意味的妥当性の判定に使うトークンの情報は、句を切り出さずに済むよう事前に取り出す
+        n = len(tokens)
+        problem_ids = _PROBLEM_START_POS_IDS
+        problem_start = [pos_id in problem_ids for pos_id in arrays.pos_ids]
+
+        # スコアの上限が最良スコアに満たない分割位置はスコア計算を省略する
+        bound = self.scorer.split_score_bound(arrays)
+        penalty_weight, max_bonus = bound if bound is not None else (0.0, math.inf)
+        cumulative = arrays.cumulative_mora
+        total_mora = cumulative[-1]
+        upper_target, middle_target, lower_target = target_pattern
+
+        # 1 <= i < j < len(tokens) の範囲で走査するため空の句は生じない
+        # ループ内では最良の分割位置のみを保持し、分割結果は最後に一度だけ作成する
+        for i in range(1, n):
+            # 枝刈りの条件はPOSAwareSplitterと同じ
+            upper_mora = cumulative[i]
+            rest_mora = total_mora - upper_mora
+            upper_penalty = abs(upper_mora - upper_target)
+            min_penalty = upper_penalty + abs(rest_mora - middle_target - lower_target)
+            if max_bonus - penalty_weight * min_penalty < best_score - SCORE_BOUND_MARGIN:
+                if upper_mora >= upper_target and rest_mora <= middle_target + lower_target:
+                    break
+                continue
+
+            for j in range(i + 1, n):
+                middle_mora = cumulative[j] - upper_mora
+                lower_mora = total_mora - cumulative[j]
+                penalty = (
+                    upper_penalty
+                    + abs(middle_mora - middle_target)
+                    + abs(lower_mora - lower_target)
+                )
+                if max_bonus - penalty_weight * penalty < best_score - SCORE_BOUND_MARGIN:
+                    if middle_mora >= middle_target and lower_mora <= lower_target:
+                        break
                     continue
 
                 # 意味的妥当性の事前チェック
-                if not self._is_semantically_valid(upper_tokens, middle_tokens, lower_tokens):
+                # 中句・下句がともに助詞・助動詞で始まる場合は除外
+                if problem_start[i] and problem_start[j]:
+                    continue
+                # 極端に短い句（1トークンのみ）が複数ある場合は除外
+                if (i == 1) + (j - i == 1) + (n - j == 1) >= 2:
                     continue
 
                 # スコア計算
-                score = self.scorer.calculate_score(
-                    upper_tokens, middle_tokens, lower_tokens, target_pattern
-                )
+                score = self.scorer.calculate_split_score(arrays, i, j, target_pattern)
 
                 if score > best_score:
                     best_score = score
-                    best_split = SplitResult(
-                        upper_tokens=upper_tokens,
-                        middle_tokens=middle_tokens,
-                        lower_tokens=lower_tokens,
-                        score=score,
-                        metadata={"splitter": "semantic_aware"},
-                    )
-
-        return best_split
+                    best_i, best_j = i, j
 
-    def _is_semantically_valid(
-        self,
-        upper_tokens: TokenList,
-        middle_tokens: TokenList,
-        lower_tokens: TokenList,
-    ) -> bool:
-        """意味的に妥当な分割かチェック。.
-
-        Args:
-            upper_tokens: 上句のトークン
-            middle_tokens: 中句のトークン
-            lower_tokens: 下句のトークン
+        if not best_i:
+            return None
 
-        Returns:
-            意味的に妥当な場合True
-        """
-        # すべての句が助詞・助動詞で始まる場合は除外
-        problem_starts = {"助詞", "助動詞"}
-
-        if (
-            middle_tokens
-            and middle_tokens[0].pos in problem_starts
-            and lower_tokens
-            and lower_tokens[0].pos in problem_starts
-        ):
-            return False
-
-        # 極端に短い句（1トークンのみ）が複数ある場合は除外
-        short_phrases = sum(
-            1 for phrase in [upper_tokens, middle_tokens, lower_tokens] if len(phrase) == 1
+        return SplitResult(
+            upper_tokens=tokens[:best_i],
+            middle_tokens=tokens[best_i:best_j],
+            lower_tokens=tokens[best_j:],
+            score=best_score,
+            metadata={"splitter": "semantic_aware"},
         )
-        if short_phrases >= 2:
-            return False
-
-        return True
 
 
 class AdaptivePOSSplitter(BaseSplitter):
@@ -251,6 +322,24 @@ class AdaptivePOSSplitter(BaseSplitter):
             tokens: 分割対象のトークンリスト
             target_pattern: 目標モーラパターン
 
+        Returns:
+            最適な分割結果
+        """
+        return self.split_arrays(TokenArrays.from_tokens(tokens), target_pattern)
+
+    def split_arrays(
+        self,
+        arrays: TokenArrays,
+        target_pattern: tuple[int, int, int],
+    ) -> SplitResult | None:
+        """事前計算済みのトークン配列を複数戦略で分割し、最高スコアを選択。.
+
+        配列は各戦略の分割器で共有する。
+
+        Args:
+            arrays: 分割対象のトークン配列
+            target_pattern: 目標モーラパターン
+
         Returns:
             最適な分割結果
         """
@@ -258,24 +347,17 @@ class AdaptivePOSSplitter(BaseSplitter):
         best_score = float("-inf")
 
         for splitter in self.splitters:
-            result = splitter.split(tokens, target_pattern)
+            result = splitter.split_arrays(arrays, target_pattern)
             if result and result.score > best_score:
                 best_score = result.score
                 best_result = result
 
         if best_result:
-            # メタデータを含む新しい結果を作成
-            updated_metadata = best_result.metadata or {}
-            updated_metadata["splitter"] = "adaptive_pos"
-
-            from .base import SplitResult
-
-            best_result = SplitResult(
-                upper_tokens=best_result.upper_tokens,
-                middle_tokens=best_result.middle_tokens,
-                lower_tokens=best_result.lower_tokens,
-                score=best_result.score,
-                metadata=updated_metadata,
-            )
+            # 各分割器は結果ごとにメタデータを新規作成するため、結果を作り直さずに更新する
+            metadata = best_result.metadata
+            if metadata is None:
+                metadata = {}
+                best_result = replace(best_result, metadata=metadata)
+            metadata["splitter"] = "adaptive_pos"
 
         return best_result
@@ -3,11 +3,120 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from itertools import accumulate, count, pairwise
+from typing import Final
 
 from ...models.senryu import Token
 
 type TokenList = list[Token]
 
+# スコアの上限との比較で、浮動小数点の丸め誤差により最良となりうる分割を除外しないための余裕
+SCORE_BOUND_MARGIN: Final[float] = 1e-9
+
+# 品詞文字列に割り当てた整数ID（固定の品詞との比較を整数比較で行うため）
+_POS_IDS: dict[str, int] = {}
+_pos_id_counter = count()
+
+
+def get_pos_id(pos: str) -> int:
+    """品詞文字列に対応する整数IDを取得。.
+
+    未登録の品詞には新しいIDを割り当てる。
+
+    Args:
+        pos: 品詞文字列
+
+    Returns:
+        品詞ごとに一意な整数ID
+    """
+    pos_id = _POS_IDS.get(pos)
+    if pos_id is None:
+        pos_id = _POS_IDS.setdefault(pos, next(_pos_id_counter))
+    return pos_id
+
+
+# 句内で隣接する品詞の組み合わせによる構造ボーナス
+_STRUCTURE_PAIR_BONUSES: Final[dict[tuple[int, int], float]] = {
+    # 名詞+助詞の組み合わせ
+    (get_pos_id("名詞"), get_pos_id("助詞")): 0.2,
+    # 形容詞/形容動詞 + 名詞の組み合わせ
+    (get_pos_id("形容詞"), get_pos_id("名詞")): 0.3,
+    (get_pos_id("形容動詞"), get_pos_id("名詞")): 0.3,
+}
+
+
+def _calculate_pair_bonuses(pos_ids: list[int]) -> list[float]:
+    """隣接するトークン(k, k + 1)ごとの構造ボーナスを計算。.
+
+    Args:
+        pos_ids: 品詞IDの配列
+
+    Returns:
+        k番目の要素がトークンkとk + 1の組み合わせのボーナスとなるリスト
+    """
+    bonuses = _STRUCTURE_PAIR_BONUSES
+    return [bonuses.get(pair, 0.0) for pair in pairwise(pos_ids)]
+
+
+@dataclass(frozen=True, slots=True)
+class TokenArrays:
+    """分割探索で繰り返し参照するトークン情報を事前計算した配列。.
+
+    分割位置(i, j)ごとにトークンリストを切り出して属性を参照する代わりに、
+    インデックス演算だけでスコアを計算できるようにする。
+    """
+
+    tokens: TokenList
+    cumulative_mora: list[int]
+    pos: list[str]
+    pos_ids: list[int]
+    pair_bonuses: list[float]
+
+    @classmethod
+    def from_tokens(cls, tokens: TokenList) -> TokenArrays:
+        """トークンリストから配列を構築。.
+
+        Args:
+            tokens: 分割対象のトークンリスト
+
+        Returns:
+            累積モーラ数（先頭からi番目のトークン直前までの合計）、品詞、品詞ID、
+            隣接トークンの構造ボーナスの配列
+        """
+        cumulative_mora = list(accumulate((token.mora_count for token in tokens), initial=0))
+        pos = [token.pos for token in tokens]
+        pos_ids = [get_pos_id(p) for p in pos]
+        return cls(
+            tokens=tokens,
+            cumulative_mora=cumulative_mora,
+            pos=pos,
+            pos_ids=pos_ids,
+            pair_bonuses=_calculate_pair_bonuses(pos_ids),
+        )
+
+    def slice(self, begin: int, end: int) -> TokenArrays:
+        """トークン区間[begin, end)の配列を切り出す。.
+
+        テキスト全体の配列から候補ごとの配列を作る際に、品詞IDや構造ボーナスを
+        再計算せずに済ませる。
+
+        Args:
+            begin: 区間の開始位置
+            end: 区間の終了位置
+
+        Returns:
+            区間のトークンに対する配列
+        """
+        base = self.cumulative_mora[begin]
+        return TokenArrays(
+            tokens=self.tokens[begin:end],
+            cumulative_mora=[mora - base for mora in self.cumulative_mora[begin : end + 1]],
+            pos=self.pos[begin:end],
+            pos_ids=self.pos_ids[begin:end],
+            pair_bonuses=self.pair_bonuses[begin : max(begin, end - 1)],
+        )
+
 
 class BaseScorer(ABC):
     """スコアリング機能の基底クラス。."""
@@ -32,6 +141,45 @@ class BaseScorer(ABC):
             スコア値（高いほど良い分割）
         """
 
+    def calculate_split_score(
+        self,
+        arrays: TokenArrays,
+        i: int,
+        j: int,
+        target_pattern: tuple[int, int, int],
+    ) -> float:
+        """分割位置に対するスコアを計算。.
+
+        上句をtokens[:i]、中句をtokens[i:j]、下句をtokens[j:]とする（1 <= i < j < len）。
+        デフォルトでは句を切り出してcalculate_scoreに委譲する。
+
+        Args:
+            arrays: 事前計算済みのトークン配列
+            i: 中句の開始位置
+            j: 下句の開始位置
+            target_pattern: 目標モーラパターン
+
+        Returns:
+            スコア値（高いほど良い分割）
+        """
+        tokens = arrays.tokens
+        return self.calculate_score(tokens[:i], tokens[i:j], tokens[j:], target_pattern)
+
+    def split_score_bound(self, arrays: TokenArrays) -> tuple[float, float] | None:
+        """分割位置によらないスコアの上限を取得。.
+
+        戻り値(penalty_weight, bonus)は、どの分割位置でもスコアが
+        bonus - penalty_weight * (各句のモーラ数の目標との差異の合計) 以下となることを表す。
+        分割器は上限が最良スコアに満たない分割位置のスコア計算を省略する。
+
+        Args:
+            arrays: 分割対象のトークン配列
+
+        Returns:
+            上限の係数のタプル、上限が不明な場合はNone
+        """
+        return None
+
 
 class MoraScorer(BaseScorer):
     """モーラ数に基づくスコアリング。."""
@@ -62,12 +210,45 @@ class MoraScorer(BaseScorer):
         Returns:
             モーラスコア（差異が小さいほど高い）
         """
-        upper_target, middle_target, lower_target = target_pattern
-
         upper_mora = sum(token.mora_count for token in upper_tokens)
         middle_mora = sum(token.mora_count for token in middle_tokens)
         lower_mora = sum(token.mora_count for token in lower_tokens)
 
+        return self._score_mora(upper_mora, middle_mora, lower_mora, target_pattern)
+
+    def calculate_split_score(
+        self,
+        arrays: TokenArrays,
+        i: int,
+        j: int,
+        target_pattern: tuple[int, int, int],
+    ) -> float:
+        """累積モーラ数から各句のモーラ数を求めてスコア計算。."""
+        cumulative = arrays.cumulative_mora
+
+        return self._score_mora(
+            cumulative[i],
+            cumulative[j] - cumulative[i],
+            cumulative[-1] - cumulative[j],
+            target_pattern,
+        )
+
+    def split_score_bound(self, arrays: TokenArrays) -> tuple[float, float] | None:
+        """モーラ数の差異の重みをそのまま上限の係数とする。."""
+        if self.penalty_weight < 0:
+            return None
+        return self.penalty_weight, 0.0
+
+    def _score_mora(
+        self,
+        upper_mora: int,
+        middle_mora: int,
+        lower_mora: int,
+        target_pattern: tuple[int, int, int],
+    ) -> float:
+        """各句のモーラ数と目標パターンの差異からスコアを計算。."""
+        upper_target, middle_target, lower_target = target_pattern
+
         # 目標パターンとの差異を計算（小さいほど良い）
         mora_penalty = (
             abs(upper_mora - upper_target)
@@ -131,6 +312,39 @@ class BoundaryScorer(BaseScorer):
 
         return score
 
+    def calculate_split_score(
+        self,
+        arrays: TokenArrays,
+        i: int,
+        j: int,
+        target_pattern: tuple[int, int, int],
+    ) -> float:
+        """品詞配列から句境界の品詞を参照してスコア計算。.
+
+        該当しない品詞は0.0として加算し、条件分岐なしの表引きで計算する。
+        """
+        pos = arrays.pos
+        upper_end, middle_start, middle_end, lower_start = pos[i - 1], pos[i], pos[j - 1], pos[j]
+        pos_bonuses = self.pos_bonuses.get
+        transition_bonuses = self.transition_bonuses.get
+        score = 0.0
+
+        # 句の終端での品詞ボーナス
+        score += pos_bonuses(upper_end, 0.0)
+        score += pos_bonuses(middle_end, 0.0)
+
+        # 句の境界での品詞遷移ボーナス
+        score += transition_bonuses((upper_end, middle_start), 0.0)
+        score += transition_bonuses((middle_end, lower_start), 0.0)
+
+        return score
+
+    def split_score_bound(self, arrays: TokenArrays) -> tuple[float, float] | None:
+        """2つの句末ボーナスと2つの遷移ボーナスの最大値の合計を上限とする。."""
+        max_pos_bonus = max([0.0, *self.pos_bonuses.values()])
+        max_transition_bonus = max([0.0, *self.transition_bonuses.values()])
+        return 0.0, 2 * max_pos_bonus + 2 * max_transition_bonus
+
 
 class SemanticScorer(BaseScorer):
     """意味的まとまりに基づくスコアリング。."""
@@ -198,6 +412,49 @@ class SemanticScorer(BaseScorer):
 
         return score
 
+    def calculate_split_score(
+        self,
+        arrays: TokenArrays,
+        i: int,
+        j: int,
+        target_pattern: tuple[int, int, int],
+    ) -> float:
+        """品詞配列から句の開始・終了品詞と句内構造を参照してスコア計算。.
+
+        該当しない品詞は0.0として加算し、条件分岐なしの表引きで計算する。
+        """
+        pos = arrays.pos
+        pair_bonuses = arrays.pair_bonuses
+        end = len(pos)
+        start_penalties = self.start_penalties.get
+        start_bonuses = self.start_bonuses.get
+        end_bonuses = self.end_bonuses.get
+        score = 0.0
+
+        # 句の開始品詞のペナルティ/ボーナス（ペナルティを優先）
+        score += start_penalties(pos[i], start_bonuses(pos[i], 0.0))
+        score += start_penalties(pos[j], start_bonuses(pos[j], 0.0))
+
+        # 句の終了品詞のボーナス
+        score += end_bonuses(pos[i - 1], 0.0)
+        score += end_bonuses(pos[j - 1], 0.0)
+        score += end_bonuses(pos[end - 1], 0.0)
+
+        # 修飾関係のボーナス
+        score += self._structure_bonus(pair_bonuses, 0, i)
+        score += self._structure_bonus(pair_bonuses, i, j)
+        score += self._structure_bonus(pair_bonuses, j, end)
+
+        return score
+
+    def split_score_bound(self, arrays: TokenArrays) -> tuple[float, float] | None:
+        """句の開始・終了品詞の最大値と正の構造ボーナスの合計を上限とする。."""
+        max_start = max([0.0, *self.start_penalties.values(), *self.start_bonuses.values()])
+        max_end = max([0.0, *self.end_bonuses.values()])
+        # 各句の構造ボーナスは隣接ペアのボーナスの部分和なので、正のものの合計以下
+        max_structure = sum(bonus for bonus in arrays.pair_bonuses if bonus > 0)
+        return 0.0, 2 * max_start + 3 * max_end + max_structure
+
     def _calculate_internal_structure_bonus(self, tokens: TokenList) -> float:
         """句内の構造に基づくボーナス計算。.
 
@@ -207,19 +464,26 @@ class SemanticScorer(BaseScorer):
         Returns:
             構造ボーナス
         """
-        bonus = 0.0
+        pair_bonuses = _calculate_pair_bonuses([get_pos_id(token.pos) for token in tokens])
+        return self._structure_bonus(pair_bonuses, 0, len(tokens))
+
+    def _structure_bonus(self, pair_bonuses: list[float], begin: int, end: int) -> float:
+        """トークン区間[begin, end)を句とみなして構造ボーナスを計算。.
 
-        for i in range(len(tokens) - 1):
-            current_pos = tokens[i].pos
-            next_pos = tokens[i + 1].pos
+        浮動小数点の加算順序を保つため、隣接ペアのボーナスを先頭から順に加算する。
+
+        Args:
+            pair_bonuses: 隣接トークンごとの構造ボーナス
+            begin: 句の開始位置
+            end: 句の終了位置（この位置を含まない）
 
-            # 名詞+助詞の組み合わせ
-            if current_pos == "名詞" and next_pos == "助詞":
-                bonus += 0.2
+        Returns:
+            構造ボーナス
+        """
+        bonus = 0.0
 
-            # 形容詞/形容動詞 + 名詞の組み合わせ
-            if current_pos in ["形容詞", "形容動詞"] and next_pos == "名詞":
-                bonus += 0.3
+        for k in range(begin, end - 1):
+            bonus += pair_bonuses[k]
 
         return bonus
 
@@ -263,6 +527,37 @@ class CompositeScorer(BaseScorer):
 
         return total_score
 
+    def calculate_split_score(
+        self,
+        arrays: TokenArrays,
+        i: int,
+        j: int,
+        target_pattern: tuple[int, int, int],
+    ) -> float:
+        """すべてのスコアラーの分割位置スコアの重み付き合計を計算。."""
+        total_score = 0.0
+
+        for scorer, weight in self.scorers:
+            score = scorer.calculate_split_score(arrays, i, j, target_pattern)
+            total_score += score * weight
+
+        return total_score
+
+    def split_score_bound(self, arrays: TokenArrays) -> tuple[float, float] | None:
+        """各スコアラーの上限の係数の重み付き合計を計算。."""
+        total_penalty_weight = 0.0
+        total_bonus = 0.0
+
+        for scorer, weight in self.scorers:
+            bound = scorer.split_score_bound(arrays)
+            if bound is None or weight < 0:
+                return None
+            penalty_weight, bonus = bound
+            total_penalty_weight += penalty_weight * weight
+            total_bonus += bonus * weight
+
+        return total_penalty_weight, total_bonus
+
     def add_scorer(self, scorer: BaseScorer, weight: float) -> None:
         """スコアラーを追加。.
 
@@ -33,29 +33,31 @@ def main(text: str | None = None) -> None:
 
             print("\n例文での検知結果:")
             for i, example in enumerate(examples, 1):
-                print(f"\n{i}. {example}")
+                # 例文ごとに表示行をまとめて組み立ててから一度に出力する
+                lines = [f"\n{i}. {example}"]
                 results = detector.detect(example)
 
                 if results:
                     for j, result in enumerate(results, 1):
-                        print(f"   結果{j}: {result}")
-                        print(f"   パターン: {result.pattern.value}")
-                        print(f"   有効: {'✅' if result.is_valid else '❌'}")
-                        print(f"   読み: {result.full_reading}")
-                        print(
+                        lines.append(f"   結果{j}: {result}")
+                        lines.append(f"   パターン: {result.pattern.value}")
+                        lines.append(f"   有効: {'✅' if result.is_valid else '❌'}")
+                        lines.append(f"   読み: {result.full_reading}")
+                        lines.append(
                             f"   上句: {result.upper_phrase.reading} "
                             f"({result.upper_phrase.mora_count}モーラ)"
                         )
-                        print(
+                        lines.append(
                             f"   中句: {result.middle_phrase.reading} "
                             f"({result.middle_phrase.mora_count}モーラ)"
                         )
-                        print(
+                        lines.append(
                             f"   下句: {result.lower_phrase.reading} "
                             f"({result.lower_phrase.mora_count}モーラ)"
                         )
                 else:
-                    print("   検知結果なし")
+                    lines.append("   検知結果なし")
+                print("\n".join(lines))
 
             print("\n" + "=" * 40)
             print("使用方法:")
@@ -72,20 +74,26 @@ def main(text: str | None = None) -> None:
     results = detector.detect(text)
 
     if results:
-        print(f"検知された川柳パターン: {len(results)}件")
+        # 検知結果の表示行をまとめて組み立ててから一度に出力する
+        lines = [f"検知された川柳パターン: {len(results)}件"]
 
         for i, result in enumerate(results, 1):
-            print(f"\n結果 {i}:")
-            print(f"  テキスト: {result.original_text}")
-            print(f"  パターン: {result.pattern.value}")
-            print(f"  有効: {'✅' if result.is_valid else '❌'}")
-            print(f"  読み: {result.full_reading}")
-            print(f"  上句: {result.upper_phrase.reading} ({result.upper_phrase.mora_count}モーラ)")
-            print(
+            lines.append(f"\n結果 {i}:")
+            lines.append(f"  テキスト: {result.original_text}")
+            lines.append(f"  パターン: {result.pattern.value}")
+            lines.append(f"  有効: {'✅' if result.is_valid else '❌'}")
+            lines.append(f"  読み: {result.full_reading}")
+            lines.append(
+                f"  上句: {result.upper_phrase.reading} ({result.upper_phrase.mora_count}モーラ)"
+            )
+            lines.append(
                 f"  中句: {result.middle_phrase.reading} ({result.middle_phrase.mora_count}モーラ)"
             )
-            print(f"  下句: {result.lower_phrase.reading} ({result.lower_phrase.mora_count}モーラ)")
-            print(f"  位置: {result.start_position}-{result.end_position}")
+            lines.append(
+                f"  下句: {result.lower_phrase.reading} ({result.lower_phrase.mora_count}モーラ)"
+            )
+            lines.append(f"  位置: {result.start_position}-{result.end_position}")
+        print("\n".join(lines))
     else:
         print("川柳パターンは検知されませんでした。")
 
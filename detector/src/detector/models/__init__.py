@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 from .api import (
+    BatchDetectItem,
+    BatchDetectRequest,
+    BatchDetectResponse,
     DetectRequest,
     DetectResponse,
     ErrorResponse,
@@ -19,6 +22,9 @@ __all__ = [
     # API models
     "DetectRequest",
     "DetectResponse",
+    "BatchDetectRequest",
+    "BatchDetectItem",
+    "BatchDetectResponse",
     "HealthResponse",
     "ErrorResponse",
 ]
@@ -32,6 +32,41 @@ class DetectResponse(BaseModel):
     count: int = Field(description="検知された川柳の数")
 
 
+class BatchDetectRequest(BaseModel):
+    """川柳一括検知APIのリクエストモデル。."""
+
+    texts: list[str] = Field(
+        description="分析する日本語テキストのリスト",
+        min_length=1,
+        max_length=100,
+        examples=[["古池や蛙飛び込む水の音", "夏草や兵どもが夢の跡"]],
+    )
+    only_valid: bool = Field(
+        default=False,
+        description="Trueの場合、有効な川柳のみを返す",
+    )
+    details: bool = Field(
+        default=False,
+        description="Trueの場合、各句の詳細情報（phrase）を含めて返す",
+    )
+
+
+class BatchDetectItem(BaseModel):
+    """一括検知におけるテキスト単位の結果。."""
+
+    text: str = Field(description="分析したテキスト")
+    results: list[DetectionResult] = Field(description="検知結果のリスト")
+    count: int = Field(description="検知された川柳の数")
+
+
+class BatchDetectResponse(BaseModel):
+    """川柳一括検知APIのレスポンスモデル。."""
+
+    success: bool = Field(description="処理が成功したかどうか")
+    results: list[BatchDetectItem] = Field(description="テキストごとの検知結果のリスト")
+    total_count: int = Field(description="全テキストで検知された川柳の総数")
+
+
 class HealthResponse(BaseModel):
     """ヘルスチェックAPIのレスポンスモデル。."""
 
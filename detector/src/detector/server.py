@@ -13,6 +13,13 @@ def main() -> None:
     # Cloud Runのポート環境変数を優先、デフォルトは8080
     port = int(os.getenv("PORT", "8080"))
 
+    # ワーカープロセス数（Sudachi辞書はmmapで読み込まれるため、
+    # 辞書のページはOSのページキャッシュを通じてワーカー間で共有される）
+    workers = int(os.getenv("WORKERS", "1"))
+
+    # アクセスログはCloud Runのロードバランサが記録するため、既定では出力しない
+    access_log = os.getenv("ACCESS_LOG", "false").lower() == "true"
+
     # ログ出力
     print(f"Starting server on port {port}...", file=sys.stderr)
 
@@ -21,8 +28,12 @@ def main() -> None:
         host="0.0.0.0",
         port=port,
         reload=False,
+        workers=workers,
         log_level="info",
-        access_log=True,
+        access_log=access_log,
+        # uvloop・httptoolsがインストールされていれば使用し、ない環境（Windows等）では標準実装を使用
+        loop="auto",
+        http="auto",
     )
 
 
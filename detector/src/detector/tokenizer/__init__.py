@@ -2,6 +2,25 @@
 
 from __future__ import annotations
 
+from .base import BaseTokenizer
+from .fugashi import FugashiTokenizer
 from .sudachi import SudachiTokenizer
 
-__all__ = ["SudachiTokenizer"]
+
+def create_tokenizer(backend: str = "sudachi") -> BaseTokenizer:
+    """バックエンド名からトークナイザーを生成。.
+
+    Args:
+        backend: 'sudachi'（SudachiPy、分割モードC）または 'fugashi'（MeCab）
+
+    Returns:
+        トークナイザーインスタンス
+    """
+    if backend == "sudachi":
+        return SudachiTokenizer(mode="C")
+    if backend == "fugashi":
+        return FugashiTokenizer()
+    raise ValueError(f"Invalid tokenizer backend: {backend}. Must be one of 'sudachi', 'fugashi'")
+
+
+__all__ = ["BaseTokenizer", "FugashiTokenizer", "SudachiTokenizer", "create_tokenizer"]
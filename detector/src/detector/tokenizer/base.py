@@ -0,0 +1,50 @@
+"""形態素解析器のベースクラス。."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Final
+
+from ..models.senryu import Token
+
+# 読みを持たない記号として扱う品詞（大分類）
+SYMBOL_POS: Final[frozenset[str]] = frozenset({"補助記号", "空白"})
+
+
+class BaseTokenizer(ABC):
+    """すべての形態素解析器の基底クラス。."""
+
+    @abstractmethod
+    def tokenize(self, text: str) -> list[Token]:
+        """テキストを形態素解析トークンに分割。.
+
+        Args:
+            text: 分割する日本語テキスト
+
+        Returns:
+            表層形、読み、モーラ数、品詞情報を含むTokenオブジェクトのリスト
+        """
+
+    def get_reading(self, text: str) -> str:
+        """テキスト全体の読みを取得。.
+
+        Args:
+            text: 日本語テキスト
+
+        Returns:
+            ひらがなでの読み
+        """
+        tokens = self.tokenize(text)
+        return "".join(token.reading for token in tokens)
+
+    def get_mora_count(self, text: str) -> int:
+        """テキストの総モーラ数を取得。.
+
+        Args:
+            text: 日本語テキスト
+
+        Returns:
+            総モーラ数
+        """
+        tokens = self.tokenize(text)
+        return sum(token.mora_count for token in tokens)
@@ -0,0 +1,84 @@
+"""形態素解析のfugashi（MeCab）ラッパー。."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from ..core.mora import count_and_normalize
+from ..models.senryu import Token
+from .base import SYMBOL_POS, BaseTokenizer
+
+
+class FugashiTokenizer(BaseTokenizer):
+    """fugashi形態素解析器のラッパークラス。.
+
+    SudachiPyより高速なMeCabを利用する。UniDic系辞書を前提とし、
+    品詞体系はSudachiTokenizerと同じ大分類（名詞、補助記号など）になる。
+    利用にはfugashiとUniDic辞書（例: `pip install 'fugashi[unidic-lite]'`）が必要。
+    """
+
+    def __init__(self) -> None:
+        """トークナイザーを初期化。."""
+        self._local = threading.local()
+
+    @property
+    def tagger(self) -> Any:
+        """現在のスレッド用のTaggerインスタンスを取得または作成。."""
+        tagger = getattr(self._local, "tagger", None)
+        if tagger is None:
+            tagger = self._create_tagger()
+            self._local.tagger = tagger
+        return tagger
+
+    def _create_tagger(self) -> Any:
+        """fugashiのTaggerを作成。."""
+        try:
+            import fugashi
+        except ImportError as e:
+            raise RuntimeError(
+                "fugashiがインストールされていません: pip install 'fugashi[unidic-lite]'"
+            ) from e
+
+        try:
+            return fugashi.Tagger()
+        except Exception as e:
+            raise RuntimeError(f"fugashiの初期化に失敗しました: {e}") from e
+
+    def tokenize(self, text: str) -> list[Token]:
+        """テキストを形態素解析トークンに分割。.
+
+        Args:
+            text: 分割する日本語テキスト
+
+        Returns:
+            表層形、読み、モーラ数、品詞情報を含むTokenオブジェクトのリスト
+        """
+        if not text.strip():
+            return []
+
+        tokens = []
+
+        for word in self.tagger(text):
+            surface = word.surface
+            pos = word.feature.pos1 or "Unknown"
+
+            if pos in SYMBOL_POS:
+                # 記号（補助記号、空白）の場合は読みを空文字列、モーラ数を0にする
+                normalized_reading = ""
+                mora_count = 0
+            else:
+                # 未知語は読みを持たないため表層形を読みとして扱う
+                reading = word.feature.kana or surface
+                normalized_reading, mora_count = count_and_normalize(reading)
+
+            tokens.append(
+                Token(
+                    surface=surface,
+                    reading=normalized_reading,
+                    mora_count=mora_count,
+                    pos=pos,
+                )
+            )
+
+        return tokens
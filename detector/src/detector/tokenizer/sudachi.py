@@ -2,14 +2,42 @@
 
 from __future__ import annotations
 
+import threading
+from functools import lru_cache
+
 import sudachipy
 
-from ..core.mora import count_mora, normalize_reading
+from ..core.mora import count_and_normalize
 from ..models.senryu import Token
+from .base import SYMBOL_POS, BaseTokenizer
+
+# 辞書の読み込みを複数スレッドで重複して行わないためのロック
+_DICTIONARY_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _load_dictionary() -> sudachipy.Dictionary:
+    """Sudachi辞書を読み込む。.
+
+    辞書の読み込みは重いため、プロセス内のすべてのSudachiTokenizerで共有する。
+    """
+    try:
+        # sudachidict-fullを使用してDictionaryを作成
+        return sudachipy.Dictionary(dict_type="full")
+    except Exception:
+        try:
+            # フォールバック: デフォルト辞書を使用（通常はfullが使われる）
+            return sudachipy.Dictionary()
+        except Exception as e:
+            raise RuntimeError(f"SudachiPyの初期化に失敗しました: {e}") from e
+
 
+class SudachiTokenizer(BaseTokenizer):
+    """SudachiPy形態素解析器のラッパークラス。.
 
-class SudachiTokenizer:
-    """SudachiPy形態素解析器のラッパークラス。."""
+    sudachipy.Tokenizerは複数スレッドから同時に使用できないため、辞書は
+    プロセス内で共有し、Tokenizerはスレッドごとに生成する。
+    """
 
     def __init__(self, mode: str = "C") -> None:
         """トークナイザーを初期化。.
@@ -17,7 +45,8 @@ class SudachiTokenizer:
         Args:
             mode: Sudachi分割モード。'A'(最短), 'B'(中間), 'C'(最長)
         """
-        self._tokenizer: sudachipy.Tokenizer | None = None
+        self._dictionary: sudachipy.Dictionary | None = None
+        self._local = threading.local()
         self._mode = self._get_split_mode(mode)
 
     def _get_split_mode(self, mode: str) -> sudachipy.SplitMode:
@@ -33,22 +62,22 @@ class SudachiTokenizer:
 
         return mode_map[mode]
 
+    @property
+    def dictionary(self) -> sudachipy.Dictionary:
+        """共有の辞書インスタンスを取得または作成。."""
+        if self._dictionary is None:
+            with _DICTIONARY_LOCK:
+                self._dictionary = _load_dictionary()
+        return self._dictionary
+
     @property
     def tokenizer(self) -> sudachipy.Tokenizer:
-        """トークナイザーインスタンスを取得または作成。."""
-        if self._tokenizer is None:
-            try:
-                # sudachidict-fullを使用してDictionaryを作成
-                dictionary = sudachipy.Dictionary(dict_type="full")
-                self._tokenizer = dictionary.create()
-            except Exception:
-                try:
-                    # フォールバック: デフォルト辞書を使用（通常はfullが使われる）
-                    dictionary = sudachipy.Dictionary()
-                    self._tokenizer = dictionary.create()
-                except Exception as e:
-                    raise RuntimeError(f"SudachiPyの初期化に失敗しました: {e}") from e
-        return self._tokenizer
+        """現在のスレッド用のトークナイザーインスタンスを取得または作成。."""
+        tokenizer: sudachipy.Tokenizer | None = getattr(self._local, "tokenizer", None)
+        if tokenizer is None:
+            tokenizer = self.dictionary.create()
+            self._local.tokenizer = tokenizer
+        return tokenizer
 
     def tokenize(self, text: str) -> list[Token]:
         """テキストを形態素解析トークンに分割。.
@@ -67,23 +96,20 @@ class SudachiTokenizer:
 
         for morpheme in morphemes:
             surface = morpheme.surface()
-            # 読み情報を取得（フィールド7が読み）
-            reading_features = morpheme.reading_form()
-
-            # カタカナの読みをひらがなに正規化
-            normalized_reading = normalize_reading(reading_features)
 
-            # モーラ数を計算
-            mora_count = count_mora(normalized_reading)
-
-            # 品詞情報を取得
+            # 品詞情報を取得（大分類のみ使用）
             pos_tags = morpheme.part_of_speech()
             pos = pos_tags[0] if pos_tags else "Unknown"
 
-            # 記号（補助記号、空白）の場合は読みを空文字列、モーラ数を0にする
-            if pos in ["補助記号", "空白"]:
+            if pos in SYMBOL_POS:
+                # 記号（補助記号、空白）の場合は読みを空文字列、モーラ数を0にする
+                # 読みは使わないため取得・正規化を省略する
                 normalized_reading = ""
                 mora_count = 0
+            else:
+                # 読み情報を取得（フィールド7が読み）し、
+                # カタカナの読みをひらがなに正規化しつつモーラ数を計算
+                normalized_reading, mora_count = count_and_normalize(morpheme.reading_form())
 
             tokens.append(
                 Token(
@@ -95,27 +121,3 @@ class SudachiTokenizer:
             )
 
         return tokens
-
-    def get_reading(self, text: str) -> str:
-        """テキスト全体の読みを取得。.
-
-        Args:
-            text: 日本語テキスト
-
-        Returns:
-            ひらがなでの読み
-        """
-        tokens = self.tokenize(text)
-        return "".join(token.reading for token in tokens)
-
-    def get_mora_count(self, text: str) -> int:
-        """テキストの総モーラ数を取得。.
-
-        Args:
-            text: 日本語テキスト
-
-        Returns:
-            総モーラ数
-        """
-        tokens = self.tokenize(text)
-        return sum(token.mora_count for token in tokens)
@@ -0,0 +1,121 @@
+"""Tests for the FastAPI application."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from detector import api
+from detector.api import _cached_detect, app
+from detector.tokenizer import FugashiTokenizer
+
+
+@pytest.fixture
+def client() -> Iterator[TestClient]:
+    """Create a test client with the application lifespan running."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+class TestHealthEndpoint:
+    """Test the /health endpoint."""
+
+    def test_health(self, client: TestClient) -> None:
+        """Test that the health check reports a healthy service."""
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "status": "healthy",
+            "message": "川柳検知システムは正常に動作しています",
+            "version": "0.1.0",
+        }
+
+
+class TestDetectEndpoint:
+    """Test the /detect endpoint."""
+
+    def test_detect_valid_senryu(self, client: TestClient) -> None:
+        """Test detection of a valid senryu."""
+        response = client.post("/detect", json={"text": "古池や蛙飛び込む水の音"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["count"] == len(data["results"]) > 0
+        assert data["results"][0]["pattern"] == "5-7-5"
+
+    def test_detect_empty_text(self, client: TestClient) -> None:
+        """Test that empty text is rejected."""
+        response = client.post("/detect", json={"text": "   "})
+
+        assert response.status_code == 400
+
+    def test_details_option(self, client: TestClient) -> None:
+        """Test that phrases are only returned when details is requested."""
+        text = "古池や蛙飛び込む水の音"
+
+        without_details = client.post("/detect", json={"text": text}).json()
+        assert without_details["results"][0]["upper_phrase"] is None
+
+        with_details = client.post("/detect", json={"text": text, "details": True}).json()
+        assert with_details["results"][0]["upper_phrase"] is not None
+
+    def test_cached_results_not_mutated(self, client: TestClient) -> None:
+        """Test that stripping details does not alter cached results."""
+        text = "夏草や兵どもが夢の跡"
+
+        client.post("/detect", json={"text": text})
+        cached = _cached_detect(text)
+
+        assert _cached_detect.cache_info().hits > 0
+        assert all(result.upper_phrase is not None for result in cached)
+
+
+class TestBatchDetectEndpoint:
+    """Test the /detect/batch endpoint."""
+
+    def test_batch_detect(self, client: TestClient) -> None:
+        """Test batch detection returns one item per input text."""
+        texts = ["古池や蛙飛び込む水の音", "こんにちは", "古池や蛙飛び込む水の音"]
+        response = client.post("/detect/batch", json={"texts": texts, "only_valid": True})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["text"] for item in data["results"]] == texts
+        assert data["results"][0]["count"] > 0
+        assert data["results"][1]["count"] == 0
+        assert data["results"][0] == data["results"][2]
+        assert data["total_count"] == sum(item["count"] for item in data["results"])
+
+    def test_batch_detect_empty_text_item(self, client: TestClient) -> None:
+        """Test that an empty text in a batch yields no results instead of an error."""
+        response = client.post("/detect/batch", json={"texts": ["", "古池や蛙飛び込む水の音"]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["results"][0]["count"] == 0
+        assert data["results"][1]["count"] > 0
+
+    def test_batch_detect_empty_list(self, client: TestClient) -> None:
+        """Test that an empty batch is rejected by validation."""
+        response = client.post("/detect/batch", json={"texts": []})
+
+        assert response.status_code == 422
+
+    def test_batch_detect_fugashi_backend(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that TOKENIZER_BACKEND selects the fugashi tokenizer for the API."""
+        pytest.importorskip("fugashi")
+        monkeypatch.setenv("TOKENIZER_BACKEND", "fugashi")
+
+        with TestClient(app) as fugashi_client:
+            assert api.detector is not None
+            assert isinstance(api.detector.tokenizer, FugashiTokenizer)
+            response = fugashi_client.post(
+                "/detect/batch", json={"texts": ["古池や蛙飛び込む水の音"], "only_valid": True}
+            )
+
+        assert response.status_code == 200
+        assert response.json()["results"][0]["count"] > 0
@@ -0,0 +1,115 @@
+"""Tests for the filter chain."""
+
+from __future__ import annotations
+
+from detector.core.filters import (
+    FilterChain,
+    JapaneseCharacterFilter,
+    MinimumTokenCountFilter,
+    MoraCountFilter,
+    PunctuationBoundaryFilter,
+    UnknownWordFilter,
+)
+from detector.models.senryu import Token
+
+
+def _token(surface: str, pos: str = "名詞", mora_count: int = 1) -> Token:
+    """Build a token whose reading is its surface."""
+    return Token(surface=surface, reading=surface, mora_count=mora_count, pos=pos)
+
+
+class TestFindNextRejected:
+    """Test precomputation of token-wise filter rejections."""
+
+    def test_next_rejected_positions(self) -> None:
+        """Test that each position points to the next rejected token."""
+        chain = FilterChain([PunctuationBoundaryFilter(), UnknownWordFilter()])
+        tokens = [
+            _token("あ"),
+            _token("。", pos="補助記号", mora_count=0),
+            _token("い"),
+            _token("abc", mora_count=0),
+            _token("う"),
+        ]
+
+        assert chain.find_next_rejected(tokens) == [1, 1, 3, 3, 5, 5]
+
+    def test_matches_filter_apply(self) -> None:
+        """Test that windows before the next rejected token pass the token filters."""
+        chain = FilterChain([PunctuationBoundaryFilter(), UnknownWordFilter()])
+        tokens = [_token("あ"), _token("！", pos="補助記号", mora_count=0), _token("い")]
+        next_rejected = chain.find_next_rejected(tokens)
+
+        for start in range(len(tokens)):
+            for end in range(start + 1, len(tokens) + 1):
+                window = tokens[start:end]
+                assert (next_rejected[start] >= end) == chain._should_pass(window)
+
+
+class TestFindNextMatched:
+    """Test precomputation of positions satisfying any-token filters."""
+
+    def test_next_matched_positions(self) -> None:
+        """Test that each position points to the next token containing Japanese."""
+        filter_ = JapaneseCharacterFilter()
+        tokens = [_token("A"), _token("あ"), _token("1"), _token("B")]
+
+        assert FilterChain().find_next_matched(tokens, [filter_]) == [1, 1, 4, 4, 4]
+
+    def test_filter_spans_matches_apply(self) -> None:
+        """Test that span filtering agrees with applying the filter to each window."""
+        filter_ = JapaneseCharacterFilter()
+        chain = FilterChain([filter_])
+        tokens = [_token("A"), _token("あ"), _token("1"), _token("B")]
+        spans = [(start, end) for start in range(4) for end in range(start + 1, 5)]
+
+        assert list(chain.filter_spans(tokens, iter(spans))) == [
+            (start, end) for start, end in spans if filter_.apply(tokens[start:end])
+        ]
+
+
+class TestFilterCandidates:
+    """Test candidate filtering."""
+
+    def test_filter_spans(self) -> None:
+        """Test that spans are filtered by the tokens they cover."""
+        chain = FilterChain([MinimumTokenCountFilter(min_count=2), PunctuationBoundaryFilter()])
+        tokens = [_token("あ"), _token("。"), _token("い")]
+        spans = [(0, 2), (1, 3), (2, 3)]
+
+        assert list(chain.filter_spans(tokens, iter(spans))) == []
+        assert list(chain.filter_spans(tokens, iter(spans), skip_token_filters=True)) == [
+            (0, 2),
+            (1, 3),
+        ]
+
+    def test_filter_spans_with_cumulative_mora(self) -> None:
+        """Test that mora total filters give the same result from cumulative mora."""
+        chain = FilterChain([MoraCountFilter(min_mora=3, max_mora=4, tolerance=0)])
+        tokens = [
+            _token("あ", mora_count=2),
+            _token("い", mora_count=1),
+            _token("う", mora_count=2),
+        ]
+        cumulative_mora = [0, 2, 3, 5]
+        spans = [(0, 1), (0, 2), (1, 3), (0, 3)]
+
+        expected = list(chain.filter_spans(tokens, iter(spans)))
+        assert expected == [(0, 2), (1, 3)]
+        assert (
+            list(chain.filter_spans(tokens, iter(spans), cumulative_mora=cumulative_mora))
+            == expected
+        )
+
+
+class TestUnknownWordFilter:
+    """Test unknown word detection."""
+
+    def test_ascii_alphanumeric_reading(self) -> None:
+        """Test that only ASCII letters and digits in readings mark unknown words."""
+        filter_ = UnknownWordFilter()
+
+        assert not filter_.accepts_token(_token("abc", mora_count=3))
+        assert not filter_.accepts_token(_token("あ1", mora_count=1))
+        assert filter_.accepts_token(_token("ａｂｃ", mora_count=3))
+        assert filter_.accepts_token(_token("あい", mora_count=2))
@@ -2,9 +2,25 @@
 
 from __future__ import annotations
 
-from detector.core.detector import SenryuDetector
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from detector.core import detector as detector_module
+from detector.core.detector import SenryuDetector, _normalize_and_check
+from detector.core.splitters import CompositeSplitter
 from detector.models.senryu import SenryuPattern
 
+# Patterns a detected senryu may have
+_VALID_PATTERNS: frozenset[SenryuPattern] = frozenset(
+    {
+        SenryuPattern.STANDARD,
+        SenryuPattern.JIAMARI_1,
+        SenryuPattern.JIAMARI_2,
+        SenryuPattern.JIAMARI_3,
+    }
+)
+
 
 class TestSenryuDetection:
     """Test full senryu detection pipeline."""
@@ -13,56 +29,53 @@ class TestSenryuDetection:
         """Set up test fixtures."""
         self.detector = SenryuDetector()
 
-    def test_famous_haiku_detection(self) -> None:
-        """Test detection of famous haiku patterns."""
-        # 松尾芭蕉の有名な俳句（川柳パターンとしてテスト）
-        test_cases = [
+    @pytest.mark.parametrize(
+        "text",
+        [
             "ふるいけやかわずとびこむみずのおと",  # 古池や蛙飛び込む水の音
             "なつくさやつわものどもがゆめのあと",  # 夏草や兵どもが夢の跡
-        ]
+        ],
+    )
+    def test_famous_haiku_detection(self, text: str) -> None:
+        """Test detection of famous haiku patterns."""
+        # 松尾芭蕉の有名な俳句（川柳パターンとしてテスト）
+        results = self.detector.detect(text)
 
-        for text in test_cases:
-            results = self.detector.detect(text)
+        # At least one result should be found
+        assert len(results) > 0
 
-            # At least one result should be found
-            assert len(results) > 0
+        # The best result should be valid
+        best_result = results[0]
+        assert best_result.is_valid
 
-            # The best result should be valid
-            best_result = results[0]
-            assert best_result.is_valid
-
-            # Should detect 5-7-5 pattern or close variant
-            mora_pattern = best_result.mora_pattern
-            assert len(mora_pattern) == 3
-            assert all(isinstance(count, int) and count > 0 for count in mora_pattern)
+        # Should detect 5-7-5 pattern or close variant
+        mora_pattern = best_result.mora_pattern
+        assert len(mora_pattern) == 3
+        assert all(isinstance(count, int) and count > 0 for count in mora_pattern)
 
-    def test_jiamari_patterns(self) -> None:
-        """Test detection of jiamari (syllable-excess) patterns."""
-        # 字余り川柳の例（仮想的な例）
-        test_cases = [
+    @pytest.mark.parametrize(
+        "text",
+        [
             # 5-8-5パターン想定
             "はるのひにさくらのはながさいている",
             # 6-7-5パターン想定
             "あきのよるつきがきれいにかがやいて",
             # 5-7-6パターン想定
             "ふゆのゆきやまにつもってしろくなる",
-        ]
-
-        for text in test_cases:
-            results = self.detector.detect(text)
+        ],
+    )
+    def test_jiamari_patterns(self, text: str) -> None:
+        """Test detection of jiamari (syllable-excess) patterns."""
+        # 字余り川柳の例（仮想的な例）
+        results = self.detector.detect(text)
 
-            # Should find at least some pattern
-            if results:  # Some may not match perfectly
-                best_result = results[0]
-                assert best_result.is_valid
+        # Should find at least some pattern
+        if results:  # Some may not match perfectly
+            best_result = results[0]
+            assert best_result.is_valid
 
-                # Pattern should be one of the valid types
-                assert best_result.pattern in [
-                    SenryuPattern.STANDARD,
-                    SenryuPattern.JIAMARI_1,
-                    SenryuPattern.JIAMARI_2,
-                    SenryuPattern.JIAMARI_3,
-                ]
+            # Pattern should be one of the valid types
+            assert best_result.pattern in _VALID_PATTERNS
 
     def test_non_senryu_text(self) -> None:
         """Test that non-senryu text produces low confidence or no results."""
@@ -101,18 +114,16 @@ class TestSenryuDetection:
 
     def test_binary_validation(self) -> None:
         """Test binary validation system."""
-        detector = SenryuDetector()
-
         # Valid senryu
         valid_text = "ふるいけやかわずとびこむみずのおと"
-        valid_results = detector.detect(valid_text)
+        valid_results = self.detector.detect(valid_text)
 
         if valid_results:
             assert valid_results[0].is_valid
 
         # Invalid text
         invalid_text = "こんにちは"
-        invalid_results = detector.detect(invalid_text)
+        invalid_results = self.detector.detect(invalid_text)
 
         # Should either have no results or invalid results
         for result in invalid_results:
@@ -120,10 +131,8 @@ class TestSenryuDetection:
 
     def test_result_validation(self) -> None:
         """Test that results have proper validation."""
-        detector = SenryuDetector()
-
         text = "ふるいけやかわずとびこむみずのおと"
-        results = detector.detect(text)
+        results = self.detector.detect(text)
 
         # All results should have is_valid field
         for result in results:
@@ -159,12 +168,7 @@ class TestSenryuDetection:
             assert 0 <= result.start_position <= result.end_position <= len(text)
 
             # Pattern should be valid
-            assert result.pattern in [
-                SenryuPattern.STANDARD,
-                SenryuPattern.JIAMARI_1,
-                SenryuPattern.JIAMARI_2,
-                SenryuPattern.JIAMARI_3,
-            ]
+            assert result.pattern in _VALID_PATTERNS
 
     def test_reading_extraction(self) -> None:
         """Test reading extraction functionality."""
@@ -245,30 +249,95 @@ class TestSenryuDetection:
             # 結果が返された場合、適切なパターンが選択されている
             best_result = results[0]
             assert best_result.is_valid
-            assert best_result.pattern in [
-                SenryuPattern.STANDARD,
-                SenryuPattern.JIAMARI_1,
-                SenryuPattern.JIAMARI_2,
-                SenryuPattern.JIAMARI_3,
-            ]
-
-    def test_edge_cases(self) -> None:
-        """Test various edge cases."""
-        edge_cases = [
+            assert best_result.pattern in _VALID_PATTERNS
+
+    @pytest.mark.parametrize(
+        "text",
+        [
             "っっっっっっっ",  # Only sokuon
             "ゃゅょゃゅょ",  # Only youon
             "ーーーーー",  # Only long vowels
             "あいうえおかきくけこ",  # Simple pattern
             "。、！？",  # Only punctuation
-        ]
+        ],
+    )
+    def test_edge_cases(self, text: str) -> None:
+        """Test various edge cases."""
+        # Should not crash, may return empty results
+        results = self.detector.detect(text)
+        assert isinstance(results, list)
 
-        for text in edge_cases:
-            # Should not crash, may return empty results
-            results = self.detector.detect(text)
-            assert isinstance(results, list)
+        # If results exist, they should be valid
+        for result in results:
+            assert isinstance(result.is_valid, bool)
+            assert result.start_position >= 0
+            assert result.end_position >= result.start_position
 
-            # If results exist, they should be valid
-            for result in results:
-                assert isinstance(result.is_valid, bool)
-                assert result.start_position >= 0
-                assert result.end_position >= result.start_position
+    def test_concurrent_detection(self) -> None:
+        """Test that a single detector can be shared across threads."""
+        texts = ["古池や蛙飛び込む水の音", "夏草や兵どもが夢の跡", "こんにちは"] * 4
+        expected = [self.detector.detect(text) for text in texts]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(self.detector.detect, texts))
+
+        assert results == expected
+
+    def test_concurrent_validation_cache_eviction(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that threads can evict validation cache entries concurrently."""
+        monkeypatch.setattr(detector_module, "VALIDATION_CACHE_SIZE", 2)
+        texts = ["古池や蛙飛び込む水の音", "夏草や兵どもが夢の跡", "柿食えば鐘が鳴るなり法隆寺"] * 8
+        expected = [SenryuDetector().detect(text) for text in texts]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(self.detector.detect, texts))
+
+        assert results == expected
+        assert len(self.detector._validation_cache) <= 2
+
+    def test_repeated_senryu_positions(self) -> None:
+        """Test that a repeated senryu is located at each occurrence."""
+        senryu = "古池や蛙飛び込む水の音"
+        text = f"{senryu}。{senryu}"
+        results = self.detector.detect(text)
+
+        start_positions = [result.start_position for result in results]
+        assert start_positions[0] == 0
+        assert len(senryu) + 1 in start_positions
+        for result in results:
+            assert text[result.start_position : result.end_position] == result.original_text
+
+    def test_preprocess_cached(self) -> None:
+        """Test that repeated detection of the same text reuses preprocessing."""
+        text = "柿食えば\n鐘が鳴るなり\n法隆寺"
+        first = self.detector.detect(text)
+        hits = _normalize_and_check.cache_info().hits
+
+        assert self.detector.detect(text) == first
+        assert _normalize_and_check.cache_info().hits == hits + 1
+
+    def test_splitter_assignment_clears_validation_cache(self) -> None:
+        """Test that assigning a new splitter discards cached validations."""
+        senryu = "古池や蛙飛び込む水の音"
+        assert self.detector.detect(senryu)
+
+        self.detector.splitter = CompositeSplitter([])
+
+        assert not self.detector._validation_cache
+        assert self.detector.detect(senryu) == []
+
+    def test_validation_cached(self) -> None:
+        """Test that cached validations give the same results at new positions."""
+        senryu = "古池や蛙飛び込む水の音"
+        self.detector.detect(senryu)
+        text = f"今日は晴れ。{senryu}"
+
+        assert self.detector._validation_cache
+        assert self.detector.detect(text) == SenryuDetector().detect(text)
+
+    def test_normalization(self) -> None:
+        """Test newline, kuten and whitespace normalization."""
+        assert _normalize_and_check(" 古池や\n\n蛙。。飛び込む 　水の音\n")[0] == (
+            "古池や。蛙。飛び込む 水の音。"
+        )
+        assert _normalize_and_check("古池や。蛙")[0] == "古池や。蛙"
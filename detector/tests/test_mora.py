@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from detector.core.mora import (
+    count_and_normalize,
     count_mora,
     is_long_vowel,
     is_special_mora,
@@ -89,6 +90,13 @@ class TestMoraCounting:
         assert count_mora("123") == 0  # No Japanese characters
         assert count_mora("あいうえお") == 5  # All vowels
 
+    def test_isolated_youon(self) -> None:
+        """Test youon without a preceding kana counts as zero mora."""
+        assert count_mora("ゃ") == 0
+        assert count_mora("ゃゅょ") == 0
+        assert count_mora("aゃ") == 0
+        assert count_mora("ゃあ") == 1
+
     def test_complex_examples(self) -> None:
         """Test complex real-world examples."""
         # 川柳の例
@@ -128,3 +136,13 @@ class TestNormalizeReading:
     def test_empty_string(self) -> None:
         """Test empty string handling."""
         assert normalize_reading("") == ""
+
+
+class TestCountAndNormalize:
+    """Test fused reading normalization and mora counting."""
+
+    def test_matches_separate_functions(self) -> None:
+        """Test that results match normalize_reading followed by count_mora."""
+        for reading in ["", "カタカナ", "コンピューター", "きょう", "ガッコウ", "ゃア", "abcア"]:
+            normalized = normalize_reading(reading)
+            assert count_and_normalize(reading) == (normalized, count_mora(normalized))
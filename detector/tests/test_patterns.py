@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from detector.core.patterns import (
     SENRYU_PATTERNS,
+    VALID_MORA_TOTALS,
     get_pattern_type,
     get_target_patterns,
     is_standard_pattern,
@@ -114,3 +115,8 @@ class TestPatternUtilities:
         assert SENRYU_PATTERNS[SenryuPattern.JIAMARI_1] == (5, 8, 5)
         assert SENRYU_PATTERNS[SenryuPattern.JIAMARI_2] == (6, 7, 5)
         assert SENRYU_PATTERNS[SenryuPattern.JIAMARI_3] == (5, 7, 6)
+
+    def test_valid_mora_totals(self) -> None:
+        """Test that valid totals match the sums of all patterns."""
+        assert {sum(pattern) for pattern in SENRYU_PATTERNS.values()} == VALID_MORA_TOTALS
+        assert VALID_MORA_TOTALS == {17, 18}
@@ -48,11 +48,7 @@ class TestPunctuationHandling:
         tokens = self.tokenizer.tokenize(text)
 
         # 句点トークンを見つける
-        period_token = None
-        for token in tokens:
-            if token.surface == "。":
-                period_token = token
-                break
+        period_token = next((token for token in tokens if token.surface == "。"), None)
 
         assert period_token is not None, "句点トークンが見つからない"
         assert period_token.reading == "", f"句点の読みが空文字列でない: {period_token.reading}"
@@ -65,11 +61,7 @@ class TestPunctuationHandling:
         tokens = self.tokenizer.tokenize(text)
 
         # 読点トークンを見つける
-        comma_token = None
-        for token in tokens:
-            if token.surface == "、":
-                comma_token = token
-                break
+        comma_token = next((token for token in tokens if token.surface == "、"), None)
 
         if comma_token is not None:
             # 読点が補助記号として認識された場合
@@ -129,11 +121,7 @@ class TestPunctuationHandling:
             text = f"テスト{symbol}文字列"
             tokens = self.tokenizer.tokenize(text)
 
-            symbol_token = None
-            for token in tokens:
-                if token.surface == symbol:
-                    symbol_token = token
-                    break
+            symbol_token = next((token for token in tokens if token.surface == symbol), None)
 
             if symbol_token is not None and symbol_token.pos == "補助記号":
                 assert (
@@ -0,0 +1,183 @@
+"""Tests for phrase splitters and scorers."""
+
+from __future__ import annotations
+
+from detector.core.splitters import (
+    AdaptivePOSSplitter,
+    BoundaryScorer,
+    CompositeScorer,
+    CompositeSplitter,
+    FlexibleMoraBasedSplitter,
+    MoraBasedSplitter,
+    MoraScorer,
+    POSAwareSplitter,
+    SemanticAwareSplitter,
+    SemanticScorer,
+    SplitResult,
+    TokenArrays,
+)
+from detector.models.senryu import Token
+
+
+def _tokens() -> list[Token]:
+    """Build the tokens of 古池や蛙飛び込む水の音."""
+    return [
+        Token(surface="古池", reading="ふるいけ", mora_count=4, pos="名詞"),
+        Token(surface="や", reading="や", mora_count=1, pos="助詞"),
+        Token(surface="蛙", reading="かわず", mora_count=3, pos="名詞"),
+        Token(surface="飛び込む", reading="とびこむ", mora_count=4, pos="動詞"),
+        Token(surface="水", reading="みず", mora_count=2, pos="名詞"),
+        Token(surface="の", reading="の", mora_count=1, pos="助詞"),
+        Token(surface="音", reading="おと", mora_count=2, pos="名詞"),
+    ]
+
+
+class TestTokenArrays:
+    """Test precomputed token arrays."""
+
+    def test_from_tokens(self) -> None:
+        """Test cumulative mora and POS arrays."""
+        tokens = _tokens()
+        arrays = TokenArrays.from_tokens(tokens)
+
+        assert arrays.tokens is tokens
+        assert arrays.cumulative_mora == [0, 4, 5, 8, 12, 14, 15, 17]
+        assert arrays.pos == [token.pos for token in tokens]
+        assert arrays.pair_bonuses == [0.2, 0.0, 0.0, 0.0, 0.2, 0.0]
+
+    def test_pos_ids(self) -> None:
+        """Test that POS ids are equal exactly when the POS strings are equal."""
+        arrays = TokenArrays.from_tokens(_tokens())
+
+        for pos_a, id_a in zip(arrays.pos, arrays.pos_ids, strict=True):
+            for pos_b, id_b in zip(arrays.pos, arrays.pos_ids, strict=True):
+                assert (pos_a == pos_b) == (id_a == id_b)
+
+
+class TestSplitScore:
+    """Test index-based split scoring."""
+
+    def test_matches_calculate_score(self) -> None:
+        """Test that split scores equal scores computed on sliced phrases."""
+        tokens = _tokens()
+        arrays = TokenArrays.from_tokens(tokens)
+        scorers = [
+            MoraScorer(penalty_weight=1.5),
+            BoundaryScorer(),
+            SemanticScorer(),
+            CompositeScorer([(MoraScorer(), 1.2), (BoundaryScorer(), 0.8)]),
+        ]
+
+        for scorer in scorers:
+            for i in range(1, len(tokens)):
+                for j in range(i + 1, len(tokens)):
+                    expected = scorer.calculate_score(
+                        tokens[:i], tokens[i:j], tokens[j:], (5, 7, 5)
+                    )
+                    assert scorer.calculate_split_score(arrays, i, j, (5, 7, 5)) == expected
+
+    def test_split_score_bound(self) -> None:
+        """Test that split scores never exceed the bound from the mora penalty."""
+        tokens = _tokens()
+        arrays = TokenArrays.from_tokens(tokens)
+        cumulative = arrays.cumulative_mora
+        scorer = CompositeScorer(
+            [(MoraScorer(), 1.0), (BoundaryScorer(), 0.6), (SemanticScorer(), 1.0)]
+        )
+        bound = scorer.split_score_bound(arrays)
+        assert bound is not None
+        penalty_weight, max_bonus = bound
+
+        for i in range(1, len(tokens)):
+            for j in range(i + 1, len(tokens)):
+                penalty = (
+                    abs(cumulative[i] - 5)
+                    + abs(cumulative[j] - cumulative[i] - 7)
+                    + abs(cumulative[-1] - cumulative[j] - 5)
+                )
+                score = scorer.calculate_split_score(arrays, i, j, (5, 7, 5))
+                assert score <= max_bonus - penalty_weight * penalty + 1e-9
+
+    def test_split_score_bound_unknown(self) -> None:
+        """Test that negative weights disable the bound."""
+        arrays = TokenArrays.from_tokens(_tokens())
+
+        assert CompositeScorer([(BoundaryScorer(), -1.0)]).split_score_bound(arrays) is None
+
+
+class TestSplitArrays:
+    """Test splitting precomputed token arrays."""
+
+    def test_slice_matches_from_tokens(self) -> None:
+        """Test that sliced arrays equal arrays built from the sliced tokens."""
+        tokens = _tokens()
+        arrays = TokenArrays.from_tokens(tokens)
+
+        for begin in range(len(tokens) + 1):
+            for end in range(begin, len(tokens) + 1):
+                assert arrays.slice(begin, end) == TokenArrays.from_tokens(tokens[begin:end])
+
+    def test_split_arrays_matches_split(self) -> None:
+        """Test that splitters return the same result for tokens and arrays."""
+        tokens = _tokens()
+        arrays = TokenArrays.from_tokens(tokens)
+        splitters = [
+            MoraBasedSplitter(),
+            FlexibleMoraBasedSplitter(),
+            POSAwareSplitter(),
+            SemanticAwareSplitter(),
+            AdaptivePOSSplitter(),
+            CompositeSplitter([MoraBasedSplitter(), POSAwareSplitter()]),
+        ]
+
+        for splitter in splitters:
+            assert splitter.split_arrays(arrays, (5, 7, 5)) == splitter.split(tokens, (5, 7, 5))
+
+
+class TestMoraBasedSplitter:
+    """Test mora-based splitting with replaced scorers."""
+
+    def test_replaced_scorer_matches_full_sweep(self) -> None:
+        """Test that the searched split positions follow the scorer's bound."""
+        tokens = _tokens()
+        arrays = TokenArrays.from_tokens(tokens)
+        scorers = [
+            CompositeScorer([(MoraScorer(penalty_weight=0.5), 1.0)]),
+            CompositeScorer([(MoraScorer(), 1.0), (BoundaryScorer(), 1.0)]),
+            CompositeScorer([(BoundaryScorer(), 1.0)]),
+            CompositeScorer([(BoundaryScorer(), -1.0)]),
+        ]
+
+        for scorer in scorers:
+            splitter = MoraBasedSplitter(tolerance=1)
+            splitter.scorer = scorer
+            best_score, best_i, best_j = float("-inf"), 0, 0
+            for i in range(1, len(tokens)):
+                for j in range(i + 1, len(tokens)):
+                    score = scorer.calculate_split_score(arrays, i, j, (5, 7, 5))
+                    if score > best_score:
+                        best_score, best_i, best_j = score, i, j
+
+            result = splitter.split_arrays(arrays, (5, 7, 5))
+            if best_score < -1:
+                assert result is None
+            else:
+                assert result is not None
+                assert result.score == best_score
+                assert len(result.upper_tokens) == best_i
+                assert len(result.upper_tokens) + len(result.middle_tokens) == best_j
+
+
+class TestSplitResult:
+    """Test split result properties."""
+
+    def test_mora_pattern(self) -> None:
+        """Test that the cached mora pattern and total match the phrase tokens."""
+        tokens = _tokens()
+        result = SplitResult(
+            upper_tokens=tokens[:2], middle_tokens=tokens[2:4], lower_tokens=tokens[4:], score=0.0
+        )
+
+        assert result.mora_pattern == (5, 7, 5)
+        assert result.mora_pattern is result.mora_pattern
+        assert result.total_mora == 17
@@ -0,0 +1,51 @@
+"""Tests for tokenizer backends."""
+
+from __future__ import annotations
+
+import pytest
+
+from detector.core.detector import SenryuDetector
+from detector.tokenizer import FugashiTokenizer, SudachiTokenizer, create_tokenizer
+
+
+class TestCreateTokenizer:
+    """Test tokenizer backend selection."""
+
+    def test_default_backend(self) -> None:
+        """Test that SudachiPy is the default backend."""
+        assert isinstance(create_tokenizer(), SudachiTokenizer)
+        assert isinstance(SenryuDetector().tokenizer, SudachiTokenizer)
+
+    def test_fugashi_backend(self) -> None:
+        """Test that the fugashi backend can be selected without importing fugashi."""
+        assert isinstance(create_tokenizer("fugashi"), FugashiTokenizer)
+
+    def test_invalid_backend(self) -> None:
+        """Test that an unknown backend is rejected."""
+        with pytest.raises(ValueError):
+            create_tokenizer("unknown")
+
+
+class TestSudachiTokenizer:
+    """Test the SudachiPy tokenizer backend."""
+
+    def test_shared_dictionary(self) -> None:
+        """Test that tokenizer instances share one loaded dictionary."""
+        assert SudachiTokenizer().dictionary is SudachiTokenizer(mode="A").dictionary
+
+
+class TestFugashiTokenizer:
+    """Test the fugashi tokenizer backend."""
+
+    def test_tokenize(self) -> None:
+        """Test that fugashi tokens follow the same reading and mora rules."""
+        pytest.importorskip("fugashi")
+        tokenizer = FugashiTokenizer()
+
+        tokens = tokenizer.tokenize("古池や、蛙飛び込む水の音")
+
+        assert "".join(token.surface for token in tokens) == "古池や、蛙飛び込む水の音"
+        comma = next(token for token in tokens if token.surface == "、")
+        assert comma.reading == ""
+        assert comma.mora_count == 0
+        assert tokenizer.get_mora_count("古池や蛙飛び込む水の音") == 17